@@ -39,13 +39,13 @@ def collect_training_data():
         print(f"Collecting articles for {subcategory}...")
         
         # Use subcategory name as query
-        articles = news_fetcher.fetch_articles(
+        articles = news_fetcher.run(news_fetcher.fetch_articles(
             query=subcategory,
             language="en",
             page_size=50,  # Get more articles for better training
             days_back=30,  # Look back 30 days
             force_refresh=True
-        )
+        ))
         
         # Add articles to training data
         for article in articles:
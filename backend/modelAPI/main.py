@@ -249,8 +249,8 @@ async def get_recommendations(user_id: str, num_recommendations: int = 5):
                 image_url=article["image_url"]
             )
             
-            recommendation_system.add_article(article_obj)
             classified_articles.append(article_obj)
+        recommendation_system.add_articles(classified_articles)
         
         # Get recommendations from the updated article pool
         recommended_articles = recommendation_system.get_recommendations(user_id, num_recommendations)
@@ -289,6 +289,11 @@ async def update_user_preferences(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.on_event("shutdown")
+async def shutdown_news_fetcher():
+    """Close the news fetcher's pooled HTTP connections on shutdown"""
+    await news_fetcher.cleanup()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
@@ -48,4 +48,35 @@ def test_classify_article(title, content):
         predicted_label = model.config.id2label[predicted_class.item()]
         confidence = confidence.item()
         
-    return predicted_label, confidence 
\ No newline at end of file
+    return predicted_label, confidence 
+
+def test_classify_article_batch(titles, contents, batch_size=32):
+    """Classify several articles using the model, batch_size articles per forward pass"""
+    # Same preprocessing as test_classify_article, so results match one-at-a-time calls
+    texts = [
+        f"{title} {content[:400] + '...' if len(content) > 400 else content}"
+        for title, content in zip(titles, contents)
+    ]
+    
+    results = []
+    with torch.inference_mode():
+        for start in range(0, len(texts), batch_size):
+            inputs = tokenizer(
+                texts[start:start + batch_size],
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=512
+            ).to(device)
+            
+            outputs = model(**inputs)
+            predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            confidences, predicted_classes = torch.max(predictions, dim=1)
+            
+            # Get the predicted labels
+            results.extend(
+                (model.config.id2label[predicted_class], confidence)
+                for predicted_class, confidence in zip(predicted_classes.tolist(), confidences.tolist())
+            )
+        
+    return results
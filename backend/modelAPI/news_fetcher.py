@@ -8,31 +8,682 @@ Implements caching, parallel processing, and content extraction.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3Error
+import atexit
+import tempfile
+import diskcache
 import feedparser
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Set
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta, timezone
 import os
-from urllib.parse import urljoin, urlparse, quote
+from urllib.parse import urljoin, urlparse, urlsplit, quote, SplitResult
 from dotenv import load_dotenv
 from newspaper import Article, Config # type: ignore
-from newsapi import NewsApiClient
 import nltk # type: ignore
-import concurrent.futures
+from nltk.corpus import stopwords # type: ignore
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 import hashlib
-import json
+import orjson
 from pathlib import Path
 import time
 import asyncio
+import multiprocessing
 import aiohttp
+from aiolimiter import AsyncLimiter
+import io
+from lxml import etree
+from lxml import html as lhtml
 from functools import lru_cache
+from collections import defaultdict, Counter, OrderedDict
+import threading
 import random
+from dataclasses import dataclass, field, asdict
 import logging
+import re
+import html as html_lib
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (set LOG_LEVEL=WARNING in production to silence per-article lines)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+# Popular RSS feeds by category, shared by the RSS fetch paths
+_RSS_FEEDS: Dict[str, Tuple[str, ...]] = {
+    'technology': (
+        'https://techcrunch.com/feed/',
+        'https://www.theverge.com/rss/index.xml',
+        'https://www.wired.com/feed/rss',
+        'https://www.engadget.com/rss.xml',
+        'https://www.zdnet.com/news/rss.xml',
+        'https://www.techradar.com/rss',
+        'https://www.digitaltrends.com/feed/',
+        'https://www.techspot.com/feeds/',
+        'https://www.techmeme.com/feed.xml',
+        'https://www.techrepublic.com/rss/',
+        'https://www.techdirt.com/feed/',
+        'https://www.techworld.com/rss',
+        'https://www.techhive.com/feed/',
+        'https://www.techrepublic.com/rss/',
+        'https://www.techspot.com/feeds/'
+    ),
+    'business': (
+        'https://www.bloomberg.com/feeds/sitemap_news.xml',
+        'https://www.reutersagency.com/feed/',
+        'https://www.ft.com/rss/home',
+        'https://www.wsj.com/xml/rss/3_7085.xml',
+        'https://www.cnbc.com/id/100003114/device/rss/rss.html',
+        'https://www.businessinsider.com/rss',
+        'https://www.marketwatch.com/rss',
+        'https://www.fool.com/feed/',
+        'https://www.investors.com/feed/',
+        'https://www.morningstar.com/rss',
+        'https://www.barrons.com/rss',
+        'https://www.fortune.com/feed/',
+        'https://www.inc.com/rss',
+        'https://www.fastcompany.com/feed',
+        'https://www.entrepreneur.com/rss'
+    ),
+    'politics': (
+        'https://www.politico.com/rss/politicopicks.xml',
+        'https://www.theguardian.com/politics/rss',
+        'https://www.nytimes.com/svc/collections/v1/publish/https://www.nytimes.com/section/politics/rss.xml',
+        'https://www.washingtonpost.com/politics/feed/',
+        'https://www.bbc.com/news/politics/rss.xml',
+        'https://www.npr.org/rss/politics/',
+        'https://www.cnn.com/politics/rss',
+        'https://www.foxnews.com/politics/rss',
+        'https://www.cbsnews.com/politics/rss/',
+        'https://www.nbcnews.com/politics/rss',
+        'https://www.abcnews.go.com/politics/rss',
+        'https://www.politifact.com/rss/',
+        'https://www.factcheck.org/feed/',
+        'https://www.opensecrets.org/rss/',
+        'https://www.rollcall.com/feed/'
+    ),
+    'entertainment': (
+        'https://www.rollingstone.com/feed/',
+        'https://www.variety.com/feed',
+        'https://www.hollywoodreporter.com/feed',
+        'https://www.ew.com/feed/',
+        'https://www.billboard.com/feed/',
+        'https://www.people.com/rss/',
+        'https://www.eonline.com/feed',
+        'https://www.usmagazine.com/feed/',
+        'https://www.etonline.com/feed',
+        'https://www.tmz.com/rss.xml',
+        'https://www.entertainmentweekly.com/feed',
+        'https://www.vulture.com/feed',
+        'https://www.pitchfork.com/feed/',
+        'https://www.spin.com/feed/',
+        'https://www.stereogum.com/feed/'
+    ),
+    'sports': (
+        'https://www.espn.com/espn/rss/news',
+        'https://www.si.com/rss/si_topstories.xml',
+        'https://www.skysports.com/rss/0,20514,11661,00.xml',
+        'https://www.bbc.com/sport/rss.xml',
+        'https://www.theguardian.com/sport/rss',
+        'https://www.cbssports.com/rss/',
+        'https://www.nbcsports.com/rss',
+        'https://www.foxsports.com/rss',
+        'https://www.sportingnews.com/rss',
+        'https://www.bleacherreport.com/rss',
+        'https://www.sportsillustrated.com/rss',
+        'https://www.nfl.com/rss',
+        'https://www.nba.com/rss',
+        'https://www.mlb.com/rss',
+        'https://www.nhl.com/rss'
+    )
+}
+
+# Homepages feed discovery starts from for well-known categories, so those skip
+# the DuckDuckGo search round trip; unknown categories still go through search
+_SEED_SITES: Dict[str, Tuple[str, ...]] = {
+    'technology': ('https://www.theverge.com', 'https://arstechnica.com', 'https://www.wired.com',
+                   'https://techcrunch.com', 'https://www.engadget.com'),
+    'business': ('https://www.cnbc.com', 'https://www.marketwatch.com', 'https://fortune.com',
+                 'https://www.businessinsider.com', 'https://www.economist.com'),
+    'politics': ('https://www.politico.com', 'https://thehill.com', 'https://www.npr.org',
+                 'https://www.rollcall.com', 'https://www.factcheck.org'),
+    'entertainment': ('https://variety.com', 'https://www.hollywoodreporter.com', 'https://www.billboard.com',
+                      'https://www.vulture.com', 'https://pitchfork.com'),
+    'sports': ('https://www.espn.com', 'https://www.cbssports.com', 'https://www.skysports.com',
+               'https://www.sportingnews.com', 'https://www.theguardian.com/sport'),
+}
+
+# Default mix when no category matches: the first 2 feeds from each category
+_DEFAULT_FEEDS: Tuple[str, ...] = tuple(feed for feeds in _RSS_FEEDS.values() for feed in feeds[:2])
+
+
+# Shared HTTP client settings: pooled keep-alive connections with a DNS cache,
+# compressed responses (brotli is decoded when the Brotli package is installed),
+# and one overall timeout per request
+_SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0',
+    'Accept-Encoding': 'gzip, deflate, br'
+}
+_SESSION_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# RSS bodies at least this long (with an image) are used as-is instead of
+# downloading and parsing the full article page
+_MIN_RSS_CONTENT_CHARS = 800
+
+# <meta property="og:image" content="..."> in either attribute order, matched on raw bytes
+_OG_IMAGE_RE = re.compile(
+    rb'<meta\s[^>]*?(?:property=["\']og:image["\'][^>]*?content=["\']([^"\']+)'
+    rb'|content=["\']([^"\']+)["\'][^>]*?property=["\']og:image["\'])',
+    re.IGNORECASE
+)
+
+# Feed downloads: per-request timeout (seconds) and how many run at once per fan-out
+_FEED_TIMEOUT = aiohttp.ClientTimeout(total=5)
+_FEED_CONCURRENCY = 16
+
+# Article page downloads: per-request timeout, tighter than the session default
+_ARTICLE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Feed validation: Content-Types that identify a feed, and the markers looked for
+# in the first bytes of the body when the Content-Type is generic
+_FEED_CONTENT_TYPES = ('rss', 'atom', 'xml')
+_FEED_MARKERS = (b'<rss', b'<feed', b'<?xml', b'<rdf:rdf')
+_FEED_SNIFF_BYTES = 2048
+# Ask servers for just the sniffed prefix; ones that ignore Range answer 200 with the full body
+_FEED_SNIFF_HEADERS = {'Range': f'bytes=0-{_FEED_SNIFF_BYTES - 1}'}
+
+# <link type="..."> values that advertise a feed, and href patterns that suggest one
+_RSS_MIME = frozenset({'application/rss+xml', 'application/atom+xml', 'application/xml'})
+_RSS_HREF_RE = re.compile(r'rss|feed|atom|\.xml', re.IGNORECASE)
+
+# Compiled XPath queries returning the feed hrefs of a page directly from lxml
+_RSS_LINK_XPATH = etree.XPath(
+    '//link[' + ' or '.join(f'@type="{mime}"' for mime in sorted(_RSS_MIME)) + ']/@href'
+)
+_RSS_ANCHOR_XPATH = etree.XPath(
+    f"//a[re:test(@href, '{_RSS_HREF_RE.pattern}', 'i')]/@href",
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
+)
+
+# Only the tags feed discovery looks at are built into the BeautifulSoup tree
+_SEARCH_RESULT_STRAINER = SoupStrainer('a', class_='result__url')
+
+# Worker threads used to fetch homepages and probe candidate feeds during discovery
+_DISCOVERY_WORKERS = 16
+
+# Persistent feed discovery cache, so warm restarts skip the search/probe requests
+_DISCOVERY_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'scr_feeds')
+_DISCOVERY_CACHE_SIZE = 50 << 20  # 50 MB
+_DISCOVERY_TTL = 86400  # 24 hours
+_VALID_FEED_MEMO_SIZE = 4096  # Feed validation results kept in memory, least recently used dropped first
+
+# Pages larger than this are skipped; newspaper3k's parse time grows with document size
+_MAX_PAGE_BYTES = 2_000_000
+
+# Worker processes for newspaper3k parsing; a fixed small pool, since every worker
+# is a full interpreter
+_PARSE_WORKERS = 4
+_READ_CHUNK_BYTES = 65536
+
+# First <img src="..."> in an HTML fragment such as an RSS summary
+_IMG_RE = re.compile(r'<img\s[^>]*?src=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# NewsAPI's cut-off marker at the end of truncated content, e.g. "… [+2345 chars]"
+_TRUNCATION_RE = re.compile(r'\s*\[\+\d+ chars\]\s*$')
+
+# Whitespace replaced by dashes in article ID slugs
+_SLUG_TABLE = str.maketrans({' ': '-', '\t': '-', '\n': '-', '\r': '-'})
+
+# Words considered for keyword extraction
+_WORD_RE = re.compile(r"[a-z]{3,}")
+
+# Retry policy for rate-limited or temporarily unavailable hosts
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.5  # Seconds, doubled on every attempt
+_MAX_RETRY_AFTER = 30.0  # Longest Retry-After (seconds) we are willing to wait
+
+# XML namespace used by Media RSS (media:content, media:thumbnail, media:group)
+_MEDIA_NS = 'http://search.yahoo.com/mrss/'
+
+# Elements holding a single feed entry in RSS (item) and Atom (entry)
+_FEED_ENTRY_TAGS = frozenset({'item', 'entry'})
+
+
+def _resolve_category(query: Optional[str], category: Optional[str]) -> Optional[str]:
+    """Single-word queries are treated as the category, otherwise the category is kept"""
+    if query and ' ' not in query:
+        return query.lower()
+    return category
+
+
+@lru_cache(maxsize=256)
+def _resolve_feeds(query: Optional[str], category: Optional[str]) -> Tuple[str, ...]:
+    """
+    Map a query/category pair to the RSS feeds to read
+    Pure and keyed on strings, so the lookup is memoized for the process
+    Args:
+        query: Search query string
+        category: News category
+    Returns:
+        The category's feeds, or the default mix when no category matches
+    """
+    category = _resolve_category(query, category)
+    return _RSS_FEEDS.get(category.lower(), _DEFAULT_FEEDS) if category else _DEFAULT_FEEDS
+
+
+@lru_cache(maxsize=32)
+def _date_window(days_back: int, minute: int) -> Tuple[str, str]:
+    """
+    NewsAPI from/to timestamps covering the last days_back days
+    Keyed on the current minute, so every request within a minute reuses the
+    same formatted strings; the window ends at the close of that minute
+    Args:
+        days_back: Length of the window in days
+        minute: int(time.time() // 60)
+    Returns:
+        (from, to) as local ISO timestamps without timezone
+    """
+    end_date = datetime.fromtimestamp((minute + 1) * 60)
+    start_date = end_date - timedelta(days=days_back)
+    return start_date.strftime('%Y-%m-%dT%H:%M:%S'), end_date.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _element_text(elem) -> str:
+    """Return the stripped text content of an element, including nested markup"""
+    return ''.join(elem.itertext()).strip()
+
+
+def _entry_from_element(elem) -> Dict:
+    """
+    Build a normalized entry dict from an RSS <item> or Atom <entry> element
+    Args:
+        elem: The lxml element of the entry
+    Returns:
+        Dictionary with title, link, published, summary and media keys
+    """
+    entry = {}
+    media_image = None
+    thumbnail = None
+    enclosure_image = None
+    
+    children = list(elem)
+    for child in children:
+        if not isinstance(child.tag, str):  # Skip comments and processing instructions
+            continue
+        qname = etree.QName(child)
+        name = qname.localname
+        
+        if qname.namespace == _MEDIA_NS:
+            if name == 'group':
+                children.extend(child)  # Media groups wrap the content/thumbnail elements
+            elif name == 'content' and media_image is None:
+                if child.get('type', '').startswith('image/') or child.get('medium') == 'image':
+                    media_image = child.get('url')
+            elif name == 'thumbnail' and thumbnail is None:
+                thumbnail = child.get('url')
+        elif name == 'title':
+            entry.setdefault('title', _element_text(child))
+        elif name == 'link':
+            href = child.get('href')
+            if href is None:
+                entry.setdefault('link', (child.text or '').strip())
+            elif child.get('rel', 'alternate') == 'alternate':
+                entry.setdefault('link', href)
+        elif name in ('pubDate', 'published', 'updated', 'date'):
+            entry.setdefault('published', _element_text(child))
+        elif name in ('description', 'summary'):
+            entry.setdefault('summary', _element_text(child))
+        elif name in ('encoded', 'content'):
+            entry.setdefault('content', _element_text(child))
+        elif name == 'enclosure' and enclosure_image is None:
+            if child.get('type', '').startswith('image/'):
+                enclosure_image = child.get('url')
+    
+    return {
+        'title': entry.get('title', ''),
+        'link': entry.get('link', ''),
+        'published': entry.get('published', ''),
+        'summary': entry.get('summary') or entry.get('content', ''),
+        'media': media_image or thumbnail or enclosure_image
+    }
+
+
+def _parse_feed_with_feedparser(body: bytes, source_fallback: str, max_entries: Optional[int] = None) -> List[Dict]:
+    """
+    Parse a feed with feedparser into the same entry shape as _parse_feed_fast
+    Used as a fallback for feeds lxml cannot make sense of
+    """
+    feed = feedparser.parse(body)
+    source = feed.feed.get('title', source_fallback)
+    entries = []
+    for entry in feed.entries[:max_entries]:
+        summary = entry.get('summary', '')
+        if not summary and entry.get('content'):
+            summary = entry.get('content')[0].get('value', '')
+        
+        entries.append({
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'published': entry.get('published', ''),
+            'summary': summary,
+            'media': _extract_rss_image(entry),
+            'source': source
+        })
+    return entries
+
+
+def _parse_feed_fast(body: bytes, source_fallback: str, max_entries: Optional[int] = None) -> List[Dict]:
+    """
+    Stream-parse RSS/Atom bytes with lxml's iterparse
+    Entries are cleared as soon as they are read so large feeds stay cheap,
+    and parsing stops once max_entries have been collected.
+    Args:
+        body: Raw feed bytes as downloaded
+        source_fallback: Source name to use when the feed has no title
+        max_entries: Maximum number of entries to return (None for all)
+    Returns:
+        List of entry dicts with title, link, published, summary, media and source keys
+    """
+    entries = []
+    source = None
+    try:
+        for _, elem in etree.iterparse(io.BytesIO(body), events=('end',), recover=True,
+                                       resolve_entities=False, no_network=True):
+            if not isinstance(elem.tag, str):
+                continue
+            name = etree.QName(elem).localname
+            if name in _FEED_ENTRY_TAGS:
+                entries.append(_entry_from_element(elem))
+                elem.clear()
+                if max_entries is not None and len(entries) >= max_entries:
+                    break
+            elif name == 'title' and source is None:
+                parent = elem.getparent()
+                if parent is not None and etree.QName(parent).localname in ('channel', 'feed'):
+                    source = _element_text(elem)
+    except etree.XMLSyntaxError:
+        entries = []
+    
+    if not entries:
+        # Malformed or unusual feeds are left to feedparser's lenient parser
+        return _parse_feed_with_feedparser(body, source_fallback, max_entries)
+    
+    source = source or source_fallback
+    for entry in entries:
+        entry['source'] = source
+    return entries
+
+
+def _slug(text: str) -> str:
+    """Build an article ID slug: the first 50 characters, whitespace as dashes, lower-cased"""
+    return text[:50].translate(_SLUG_TABLE).lower()
+
+
+@lru_cache(maxsize=1024)
+def _cached_urljoin(url: str, href: str) -> str:
+    """urljoin for page-relative hrefs, memoized since site navigation repeats them"""
+    return urljoin(url, href)
+
+
+def _join_href(url: str, base: SplitResult, href: str) -> str:
+    """
+    Resolve a link found on a page against the page URL
+    Absolute, scheme-relative and root-relative hrefs (nearly all of them) are
+    joined by string concatenation; anything else goes through a memoized urljoin
+    Args:
+        url: The page URL
+        base: urlsplit(url), computed once per page
+        href: The link as written in the page
+    Returns:
+        The absolute URL
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('//'):
+        return f"{base.scheme}:{href}"
+    if href.startswith('/'):
+        return f"{base.scheme}://{base.netloc}{href}"
+    return _cached_urljoin(url, href)
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize an article URL for duplicate detection
+    Drops the scheme, query string, fragment and trailing slash and lowercases
+    the host, so tracking parameters and syndication variants of the same story
+    map to one key
+    """
+    parsed = urlparse(url)
+    return f"{parsed.netloc.lower()}{parsed.path}".rstrip('/') or url
+
+
+def _og_image(body: bytes) -> Optional[str]:
+    """
+    Find the Open Graph image of a page without building a DOM
+    Args:
+        body: Raw HTML bytes
+    Returns:
+        The og:image URL, or None if the page doesn't declare one
+    """
+    match = _OG_IMAGE_RE.search(body)
+    if not match:
+        return None
+    url = (match.group(1) or match.group(2)).decode('utf-8', 'replace')
+    return html_lib.unescape(url).strip() or None
+
+
+def _extract_main_text(html: str) -> str:
+    """
+    Fallback text extraction for pages newspaper3k finds no body text on
+    Takes the paragraphs of the first <article> or <main> element. By the time
+    this runs newspaper3k has already parsed the whole page, so stopping the
+    pull parser at the first match only saves this second parse, not memory
+    Args:
+        html: The decoded page HTML
+    Returns:
+        The paragraphs of the first <article>/<main>, or "" if there is none
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag=('article', 'main'))
+    for start in range(0, len(html), _READ_CHUNK_BYTES):
+        parser.feed(html[start:start + _READ_CHUNK_BYTES])
+        for _, element in parser.read_events():
+            paragraphs = (''.join(p.itertext()).strip() for p in element.iter('p'))
+            return '\n\n'.join(p for p in paragraphs if p)
+    return ''
+
+
+def _newspaper_config() -> Config:
+    """Build the newspaper3k configuration used for article parsing"""
+    config = Config()
+    config.browser_user_agent = 'Mozilla/5.0'
+    config.request_timeout = 3
+    config.fetch_images = False
+    config.memoize_articles = False  # Disable memoization
+    return config
+
+
+# newspaper3k configuration of a parse worker process, set by _init_parse_worker
+_worker_config: Optional[Config] = None
+
+
+def _init_parse_worker():
+    """Parse pool initializer: build the newspaper3k configuration once per worker"""
+    global _worker_config
+    _worker_config = _newspaper_config()
+
+
+def _parse_article_html(html: str, url: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a downloaded article page with newspaper3k
+    Runs in a worker process, so it only takes and returns picklable values
+    Args:
+        html: The decoded page HTML
+        url: The article URL
+    Returns:
+        Dictionary with the title, text, top_image and ISO publish_date
+    """
+    article = Article(url, config=_worker_config or _newspaper_config())
+    article.set_html(html)
+    article.parse()
+    
+    publish_date = None
+    if article.publish_date:
+        try:
+            publish_date = article.publish_date.isoformat()
+        except Exception as e:
+            logger.warning("Failed to format publish date: %s", e)
+    
+    return {
+        "title": article.title,
+        "text": article.text or _extract_main_text(html),
+        "top_image": article.top_image,
+        "publish_date": publish_date
+    }
+
+
+async def _read_capped(response: aiohttp.ClientResponse, limit: int) -> Optional[bytes]:
+    """
+    Read a response body, giving up once it grows past a size limit
+    Checks Content-Length first, then guards chunked responses while streaming
+    Args:
+        response: The aiohttp response to read
+        limit: Maximum number of bytes to accept
+    Returns:
+        The body bytes, or None if the body is larger than the limit
+    """
+    if (response.content_length or 0) > limit:
+        return None
+    
+    chunks = []
+    total = 0
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_BYTES):
+        total += len(chunk)
+        if total > limit:
+            return None
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def _image_from_typed_media(items: List[Dict]) -> Optional[str]:
+    """First URL among media_content/enclosure items whose type is an image"""
+    for item in items:
+        if item.get("type", "").startswith("image/") and item.get("url"):
+            return item["url"]
+    return None
+
+
+def _image_from_thumbnails(thumbnails: List[Dict]) -> Optional[str]:
+    """URL of the first media_thumbnail"""
+    return thumbnails[0].get("url") or None
+
+
+def _image_from_html(summary: str) -> Optional[str]:
+    """src of the first <img> in an HTML fragment"""
+    # Most summaries are plain text; a substring scan rules them out before the regex runs
+    if '<img' not in summary.lower():
+        return None
+    match = _IMG_RE.search(summary)
+    return html_lib.unescape(match.group(1)) if match else None
+
+
+# Where an RSS entry may carry its image, in order of preference
+_RSS_IMAGE_EXTRACTORS = (
+    ("media_content", _image_from_typed_media),
+    ("media_thumbnail", _image_from_thumbnails),
+    ("enclosures", _image_from_typed_media),
+    ("summary", _image_from_html),
+)
+
+
+def _extract_rss_image(entry: Dict) -> Optional[str]:
+    """
+    Find the image of a feedparser-style RSS entry
+    Tries each field of _RSS_IMAGE_EXTRACTORS in order, returning at the first
+    hit, so the summary HTML is only searched when no media field has one
+    Args:
+        entry: The RSS entry dictionary
+    Returns:
+        The image URL, or None if the entry has no image
+    """
+    for key, extract in _RSS_IMAGE_EXTRACTORS:
+        value = entry.get(key)
+        if value:
+            image_url = extract(value)
+            if image_url:
+                return image_url
+    return None
+
+
+def _needs_extraction(article: Dict) -> bool:
+    """Whether an RSS article is too thin to use without fetching the full page"""
+    return len(article.get('content') or '') < _MIN_RSS_CONTENT_CHARS or not article.get('image_url')
+
+
+def _best_api_text(description: Optional[str], content: Optional[str]) -> Tuple[str, bool]:
+    """
+    Pick the fuller of a NewsAPI article's description and content
+    Args:
+        description: The article description
+        content: The article content, usually cut off with a "[+N chars]" marker
+    Returns:
+        (text, truncated): the longer text without its cut-off marker, and
+        whether that text had been cut off
+    """
+    best, truncated = '', False
+    for text in (description or '', content or ''):
+        stripped = _TRUNCATION_RE.sub('', text)
+        if len(stripped) > len(best):
+            best = stripped
+            truncated = stripped != text or stripped.endswith(('...', '…'))
+    return best, truncated
+
+
+def _dedupe_articles(articles: List[Dict]) -> List[Dict]:
+    """
+    Drop articles whose canonical URL has already been seen, keeping the first
+    Args:
+        articles: List of article dictionaries with a 'url' key
+    Returns:
+        List of articles with unique URLs, in their original order
+    """
+    # Insertion-ordered dict: setdefault keeps the first article per key in one lookup
+    unique_articles: Dict[str, Dict] = {}
+    for article in articles:
+        key = _canonical_url(article.get('url') or '')
+        if key:
+            unique_articles.setdefault(key, article)
+    return list(unique_articles.values())
+
+
+@dataclass(slots=True)
+class ArticleRecord:
+    """
+    Article built while fetching, before it is handed out as a plain dict
+    Slotted so large result pages don't pay for a per-article __dict__
+    """
+    article_id: str
+    title: str
+    content: str
+    source: str
+    url: str
+    published_at: Optional[str]
+    image_url: Optional[str]
+    category: str = "other"
+    summary: str = ""
+    keywords: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _CachedFeed:
+    """Validators and parsed entries from a feed's last full download"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    max_entries: Optional[int]
+    entries: List[Dict]
+
+
 class Timer:
     """
     Context manager for timing operations
@@ -50,7 +701,7 @@ class Timer:
     def __exit__(self, *args):
         self.end_time = time.time()
         duration = self.end_time - self.start_time
-        logger.info(f"{self.name} took {duration:.2f} seconds")
+        logger.info("%s took %.2f seconds", self.name, duration)
 
 class NewsFetcher:
     """
@@ -59,23 +710,44 @@ class NewsFetcher:
     """
     def __init__(self):
         # Initialize API clients and configuration
-        self.newsapi = NewsApiClient(api_key=os.getenv("NEWS_API_KEY"))
         self.newsapi_key = os.getenv("NEWS_API_KEY")
         self.newsapi_base_url = "https://newsapi.org/v2/"
         self.newsdata_api_key = os.getenv("NEWSDATA_API_KEY")
         self.base_url = "https://newsdata.io/api/1/latest"
         self.discovered_feeds: Dict[str, Set[str]] = {}
+        self._discovery_cache = diskcache.Cache(_DISCOVERY_CACHE_DIR, size_limit=_DISCOVERY_CACHE_SIZE)
+        # In-process memo of feed validation results (url -> (is_valid, expiry)),
+        # consulted before the disk cache so repeat checks skip SQLite entirely
+        # LRU-bounded; guarded by a lock since discovery checks feeds from worker threads
+        self._valid_feed_memo: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self._valid_feed_lock = threading.Lock()
         
-        # Configure newspaper3k for article parsing
-        self.newspaper_config = Config()
-        self.newspaper_config.browser_user_agent = 'Mozilla/5.0'
-        self.newspaper_config.request_timeout = 3
-        self.newspaper_config.fetch_images = False
-        self.newspaper_config.memoize_articles = False  # Disable memoization
+        # Validators and parsed entries of previously downloaded feeds, for conditional GETs
+        self._feed_cache: Dict[str, _CachedFeed] = {}
+        
+        # Process pool for CPU-bound newspaper3k parsing, created on first use
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         
         # Initialize async session management
         self.session = None
         self.session_lock = asyncio.Lock()
+        self._session_loop = None  # Event loop the current session was created on
+        
+        # Shared requests session for the synchronous paths, so connections are kept alive
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,  # Room for every feed discovery worker thread
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers.update(_SESSION_HEADERS)  # Same UA and gzip/br encodings as aiohttp
+        atexit.register(self.close)
+        
+        # Per-host token buckets so bursts don't trigger 429s from publishers or NewsAPI
+        self._host_limiters: Dict[str, AsyncLimiter] = defaultdict(lambda: AsyncLimiter(10, 1))
+        self._host_limiters["newsapi.org"] = AsyncLimiter(1, 1)
         
         # List of trusted news sources
         self.news_sources = [
@@ -86,36 +758,205 @@ class NewsFetcher:
             "engadget", "ars-technica", "techradar", "venturebeat"
         ]
         
-        # Download required NLTK data for text processing
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            print("Downloading NLTK punkt data...")
-            nltk.download('punkt')
+        # Stopwords for keyword extraction, loaded on first use
+        self._stopwords: Optional[frozenset] = None
             
-        try:
-            nltk.data.find('tokenizers/punkt_tab')
-        except LookupError:
-            print("Downloading NLTK punkt_tab data...")
-            nltk.download('punkt_tab')
+    def close(self):
+        """Close the synchronous HTTP session, the feed discovery cache and the parse pool"""
+        self.http.close()
+        self._discovery_cache.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+            
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Get or create the process pool used to parse article HTML"""
+        if self._parse_pool is None:
+            # Workers must not be forked from the server process: it already runs
+            # threads (fork can deadlock on their locks) and holds the model in memory
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=_PARSE_WORKERS,
+                mp_context=context,
+                initializer=_init_parse_worker
+            )
+        return self._parse_pool
         
+    async def _parse_in_pool(self, html: str, url: str) -> Dict[str, Optional[str]]:
+        """
+        Parse an article page in the process pool
+        If a worker died and broke the pool, the pool is replaced and the parse retried once
+        Args:
+            html: The decoded page HTML
+            url: The article URL
+        Returns:
+            The result of _parse_article_html
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_parse_pool()
         try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            print("Downloading NLTK stopwords data...")
-            nltk.download('stopwords')
+            return await loop.run_in_executor(pool, _parse_article_html, html, url)
+        except BrokenProcessPool:
+            logger.warning("Article parse pool broke, restarting it")
+            # Other parses may have hit the same broken pool; only the first replaces it
+            if self._parse_pool is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                self._parse_pool = None
+            return await loop.run_in_executor(self._get_parse_pool(), _parse_article_html, html, url)
+        
+    def _get_stopwords(self) -> frozenset:
+        """
+        Load the NLTK English stopwords, downloading them if needed
+        Only keyword extraction uses them, so this happens on its first call
+        Returns:
+            The stopwords, or an empty set if they are unavailable
+        """
+        if self._stopwords is None:
+            try:
+                nltk.data.find('corpora/stopwords')
+            except LookupError:
+                logger.info("Downloading NLTK stopwords data...")
+                nltk.download('stopwords')
             
+            # Loaded once so keyword extraction only does set lookups
+            try:
+                self._stopwords = frozenset(stopwords.words('english'))
+            except LookupError:
+                logger.warning("NLTK stopwords unavailable, keywords will include stopwords")
+                self._stopwords = frozenset()
+        return self._stopwords
+        
+    def _keywords(self, text: str, count: int = 10) -> List[str]:
+        """
+        Extract the most frequent non-stopword terms from article text
+        A lightweight replacement for newspaper3k's article.nlp()
+        Args:
+            text: The article text
+            count: Number of keywords to return
+        Returns:
+            List of keywords, most frequent first
+        """
+        stop = self._get_stopwords()
+        words = (word for word in _WORD_RE.findall(text.lower()) if word not in stop)
+        return [word for word, _ in Counter(words).most_common(count)]
+        
     async def _get_session(self):
         """
         Get or create an aiohttp session for async requests
+        The session is kept open across calls so TCP/TLS connections are reused;
+        it is only recreated when closed or when called from a different event loop
+        (e.g. successive run() calls from the sync entry points, which close it on exit)
         Uses a lock to prevent multiple simultaneous session creations
         """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # Sessions and locks are bound to the loop that created them
+            self.session = None
+            self.session_lock = asyncio.Lock()
+            self._session_loop = loop
+            
         if self.session is None or self.session.closed:
             async with self.session_lock:
                 if self.session is None or self.session.closed:
-                    self.session = aiohttp.ClientSession()
+                    connector = aiohttp.TCPConnector(
+                        limit=100,
+                        limit_per_host=8,
+                        ttl_dns_cache=300,
+                        enable_cleanup_closed=True,
+                        keepalive_timeout=30
+                    )
+                    self.session = aiohttp.ClientSession(
+                        connector=connector,
+                        headers=_SESSION_HEADERS,
+                        timeout=_SESSION_TIMEOUT
+                    )
         return self.session
             
+    async def _get(self, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Rate-limited GET through the shared aiohttp session
+        Requests are throttled per host and retried with exponential backoff
+        when the server answers 429 (Too Many Requests) or 503 (Service Unavailable)
+        Args:
+            url: The URL to request
+            **kwargs: Extra arguments passed to session.get
+        Returns:
+            The aiohttp response; callers release it with "async with response"
+        """
+        session = await self._get_session()
+        limiter = self._host_limiters[urlparse(url).hostname or ""]
+        
+        for attempt in range(_MAX_RETRIES + 1):
+            async with limiter:
+                response = await session.get(url, **kwargs)
+            if response.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                return response
+            
+            response.release()
+            # Honour the server's Retry-After when it gives one in seconds
+            delay = _RETRY_BACKOFF * (2 ** attempt)
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(float(retry_after), _MAX_RETRY_AFTER)
+            logger.warning("HTTP %s from %s, retrying in %.1fs", response.status, url, delay)
+            await asyncio.sleep(delay)
+            
+    async def _fetch_feed_entries(self, feed_url: str, semaphore: asyncio.Semaphore,
+                                  max_entries: Optional[int] = None) -> List[Dict]:
+        """
+        Download and parse a feed through the shared session
+        Sends If-None-Match/If-Modified-Since from the previous download, so an
+        unchanged feed costs a bodiless 304 and no parsing
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            semaphore: Bounds how many feeds of one fan-out are fetched at once
+            max_entries: Maximum number of entries to return (None for all)
+        Returns:
+            List of normalized feed entries (see _parse_feed_fast)
+        """
+        cached = self._feed_cache.get(feed_url)
+        # Cached entries can only answer requests for as many entries as were parsed
+        if cached and cached.max_entries is not None and (max_entries is None or max_entries > cached.max_entries):
+            cached = None
+        
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        
+        async with semaphore:
+            # Through _get, so feeds share the per-host rate limits and 429/503 retries
+            async with await self._get(feed_url, timeout=_FEED_TIMEOUT, headers=headers) as response:
+                if response.status == 304 and cached:
+                    return cached.entries[:max_entries]
+                if response.status != 200:
+                    return []
+                body = await response.read()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        
+        entries = _parse_feed_fast(body, 'Unknown Source', max_entries=max_entries)
+        if etag or last_modified:
+            self._feed_cache[feed_url] = _CachedFeed(etag, last_modified, max_entries, entries)
+        return entries
+                
+    async def _fetch_feeds_async(self, feed_urls: List[str]) -> List:
+        """
+        Download and parse many feeds concurrently, for the synchronous entry points
+        Args:
+            feed_urls: URLs of the RSS/Atom feeds
+        Returns:
+            One item per URL, in order: its list of entries, or the exception raised
+        """
+        semaphore = asyncio.Semaphore(_FEED_CONCURRENCY)
+        return await asyncio.gather(
+            *(self._fetch_feed_entries(feed_url, semaphore) for feed_url in feed_urls),
+            return_exceptions=True
+        )
+            
     async def _close_session(self):
         """Close the aiohttp session if it exists and is open"""
         if self.session and not self.session.closed:
@@ -128,9 +969,21 @@ class NewsFetcher:
         Args:
             url: The URL to generate a key for
         Returns:
-            MD5 hash of the URL
+            BLAKE2b hash of the URL
+        """
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        
+    @staticmethod
+    def _short_id(s: str) -> str:
+        """
+        Generate a short, process-stable identifier for a string
+        Unlike hash(), the result does not change with PYTHONHASHSEED
+        Args:
+            s: The string (usually a URL) to identify
+        Returns:
+            8 character hex digest
         """
-        return hashlib.md5(url.encode()).hexdigest()
+        return hashlib.blake2b(s.encode('utf-8', 'ignore'), digest_size=4).hexdigest()
         
     @lru_cache(maxsize=1000)
     def _get_cached_content(self, url: str) -> Optional[Dict]:
@@ -146,13 +999,12 @@ class NewsFetcher:
         
         if cache_file.exists():
             try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    # Check if cache is less than 24 hours old
-                    if time.time() - cached_data.get('timestamp', 0) < 86400:
-                        return cached_data.get('data')
+                cached_data = orjson.loads(cache_file.read_bytes())
+                # Check if cache is less than 24 hours old
+                if time.time() - cached_data.get('timestamp', 0) < 86400:
+                    return cached_data.get('data')
             except Exception as e:
-                print(f"Error reading cache for {url}: {str(e)}")
+                logger.warning("Error reading cache for %s: %s", url, e)
         return None
         
     def _save_to_cache(self, url: str, data: Dict):
@@ -166,109 +1018,113 @@ class NewsFetcher:
         cache_file = self.cache_dir / f"{cache_key}.json"
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'timestamp': time.time(),
-                    'data': data
-                }, f)
+            cache_file.write_bytes(orjson.dumps({
+                'timestamp': time.time(),
+                'data': data
+            }))
         except Exception as e:
-            print(f"Error saving cache for {url}: {str(e)}")
+            logger.warning("Error saving cache for %s: %s", url, e)
             
-    async def _extract_article_content_async(self, url: str, original_title: str = "") -> Dict[str, str]:
+    async def _extract_article_content_async(self, url: str, original_title: str = "",
+                                             need_keywords: bool = False) -> Dict[str, str]:
         """
         Asynchronously extract content from an article URL
         Args:
             url: The article URL to extract from
             original_title: The original title from the feed/API
+            need_keywords: Whether to compute keywords (no current caller reads them)
         Returns:
             Dictionary containing extracted article data
         """
+        # Single timezone-aware timestamp for every fallback path below
+        fallback_iso = datetime.now(timezone.utc).isoformat()
         try:
             with Timer(f"Extracting content from {url}"):
-                session = await self._get_session()
-                
-                async with session.get(url, timeout=10) as response:
+                response = await self._get(url, timeout=_ARTICLE_TIMEOUT)
+                async with response:
                     if response.status != 200:
                         raise Exception(f"HTTP {response.status}")
                         
-                    html = await response.text()
-                    article = Article(url, config=self.newspaper_config)
-                    article.set_html(html)
-                    article.parse()
-                    
-                    # Only run NLP if we have content
-                    if article.text:
-                        try:
-                            article.nlp()  # Extract keywords, summary, etc.
-                        except Exception as e:
-                            logger.warning(f"NLP processing failed: {str(e)}")
-                    
-                    # Use extracted title if available and different from original
-                    final_title = article.title if article.title and article.title != original_title else original_title
+                    body = await _read_capped(response, _MAX_PAGE_BYTES)
+                    if body is None:
+                        # Callers keep the feed/API content for oversized pages
+                        raise Exception(f"Page larger than {_MAX_PAGE_BYTES} bytes")
                     
-                    # Get published date with fallback
-                    published_at = None
-                    if article.publish_date:
-                        try:
-                            published_at = article.publish_date.isoformat()
-                        except Exception as e:
-                            logger.warning(f"Failed to format publish date: {str(e)}")
+                    # Most news sites declare their lead image in og:image
+                    image_url = _og_image(body)
                     
-                    if not published_at:
-                        published_at = datetime.now().isoformat()
-                        logger.info(f"Using current time as fallback for publish date: {published_at}")
-                    
-                    return {
-                        "title": final_title,
-                        "content": article.text,
-                        "image_url": article.top_image,
-                        "published_at": published_at,
-                        "summary": article.summary if hasattr(article, 'summary') else "",
-                        "keywords": article.keywords if hasattr(article, 'keywords') else []
-                    }
+                    html = body.decode(response.charset or 'utf-8', errors='replace')
+                
+                # Parsing is CPU-bound, so it runs in the process pool instead of blocking the event loop
+                parsed = await self._parse_in_pool(html, url)
+                text = parsed["text"]
+                
+                # Use extracted title if available and different from original
+                final_title = parsed["title"] if parsed["title"] and parsed["title"] != original_title else original_title
+                
+                # Get published date with fallback
+                published_at = parsed["publish_date"]
+                if not published_at:
+                    published_at = fallback_iso
+                    logger.info("Using current time as fallback for publish date: %s", published_at)
+                
+                return {
+                    "title": final_title,
+                    "content": text,
+                    "image_url": image_url or parsed["top_image"],
+                    "published_at": published_at,
+                    "summary": "",
+                    "keywords": self._keywords(text) if need_keywords and text else []
+                }
                     
         except Exception as e:
-            logger.error(f"Error extracting article content from {url}: {str(e)}")
+            logger.error("Error extracting article content from %s: %s", url, e)
             return {
                 "title": original_title,  # Keep the original title
                 "content": "",
                 "image_url": None,
-                "published_at": datetime.now().isoformat(),  # Use current time as fallback
+                "published_at": fallback_iso,  # Use current time as fallback
                 "summary": "",
                 "keywords": []
             }
             
-    async def _extract_articles_parallel_async(self, articles: List[Dict]) -> List[Dict]:
+    async def _extract_articles_parallel_async(self, articles: List[Dict], max_concurrency: int = 20) -> List[Dict]:
         """
         Extract content from multiple articles in parallel using async
+        All extractions run inside one TaskGroup, so any still pending when the
+        group exits are cancelled instead of being left running in the background
         Args:
             articles: List of article dictionaries to process
+            max_concurrency: Maximum number of extractions in flight at once
         Returns:
             List of processed articles with extracted content
         """
-        tasks = []
-        for article in articles:
-            if article.get('url'):
-                task = asyncio.create_task(
-                    self._extract_article_content_async(
-                        article['url'],
-                        article.get('title', '')
-                    )
-                )
-                tasks.append((article, task))
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # Process results as they complete
-        processed_articles = []
-        for article, task in tasks:
+        async def extract(article: Dict) -> Optional[Dict]:
             try:
-                extracted_data = await asyncio.wait_for(task, timeout=15)  # 15 second timeout per article
-                if extracted_data.get('content'):
-                    article.update(extracted_data)
-                    processed_articles.append(article)
-            except asyncio.TimeoutError:
-                print(f"Timeout extracting content from: {article.get('url')}")
+                async with semaphore:
+                    async with asyncio.timeout(15):  # 15 second timeout per article
+                        return await self._extract_article_content_async(
+                            article['url'],
+                            article.get('title', '')
+                        )
+            except TimeoutError:
+                logger.warning("Timeout extracting content from: %s", article.get('url'))
             except Exception as e:
-                print(f"Error processing article {article.get('url')}: {str(e)}")
+                logger.warning("Error processing article %s: %s", article.get('url'), e)
+            return None
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [(article, tg.create_task(extract(article))) for article in articles if article.get('url')]
+        
+        # Keep the articles whose content could be extracted, in their original order
+        processed_articles = []
+        for article, task in tasks:
+            extracted_data = task.result()
+            if extracted_data and extracted_data.get('content'):
+                article.update(extracted_data)
+                processed_articles.append(article)
         
         return processed_articles
 
@@ -303,34 +1159,31 @@ class NewsFetcher:
                 return []
 
             try:
-                logger.info(f"Making NewsAPI request with query: {query}")
+                logger.info("Making NewsAPI request with query: %s", query)
                 
-                # Basic parameters for NewsAPI
+                # Basic parameters for NewsAPI (the /everything endpoint has no
+                # category filter, so the category doubles as the query)
                 params = {
-                    'q': query,
+                    'q': query or category,
                     'language': language,
-                    'sort_by': sort_by,
-                    'page_size': page_size,
+                    'sortBy': sort_by,
+                    'pageSize': page_size,
                     'page': page
                 }
-                
-                # Add category if specified
-                if category:
-                    params['category'] = category
                     
                 # Add date range if specified
                 if days_back:
-                    from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-                    params['from'] = from_date
+                    from_date, _ = _date_window(days_back, int(time.time() // 60))
+                    params['from'] = from_date[:10]
                 
-                # Make the API request
-                response = self.newsapi.get_everything(**params)
+                data = await self._newsapi_everything(params)
                 
-                if response['status'] != 'ok':
-                    logger.error(f"NewsAPI error: {response.get('message', 'Unknown error')}")
+                if data.get('status') != 'ok':
+                    logger.error("NewsAPI error: %s", data.get('message', 'Unknown error'))
                     return []
                     
-                articles = response['articles']
+                # Skip syndicated copies so each story is only extracted once
+                articles = _dedupe_articles(data.get('articles', []))
                 
                 # Process articles in parallel
                 processed_articles = await self._extract_articles_parallel_async(articles)
@@ -338,9 +1191,28 @@ class NewsFetcher:
                 return processed_articles
                 
             except Exception as e:
-                logger.error(f"Error fetching articles: {str(e)}")
+                logger.error("Error fetching articles: %s", e)
                 return []
 
+    async def _newsapi_everything(self, params: Dict) -> Dict:
+        """
+        Call NewsAPI's /everything endpoint through the shared, rate-limited session
+        Args:
+            params: Query parameters in NewsAPI's REST names (q, sortBy, pageSize, from, ...)
+        Returns:
+            The decoded JSON response
+        """
+        # Remove None values, which aiohttp cannot encode
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = await self._get(
+            f"{self.newsapi_base_url}everything",
+            params=params,
+            headers={'X-Api-Key': self.newsapi_key}
+        )
+        async with response:
+            return orjson.loads(await response.read())
+
     def _get_random_sources(self, count: int = 5) -> List[str]:
         """Get a random selection of news sources"""
         return random.sample(self.news_sources, min(count, len(self.news_sources)))
@@ -386,6 +1258,22 @@ class NewsFetcher:
             articles_per_category = max(1, page_size // len(categories))
             all_articles = []
             
+            # Start the NewsAPI fallback alongside the feeds, so a short RSS result
+            # costs max(rss, newsapi) rather than the sum of both
+            newsapi_task = None
+            if not use_rss_only:
+                newsapi_task = asyncio.create_task(self._fetch_articles_from_newsapi(
+                    query=query,
+                    category=category,
+                    language=language,
+                    page_size=page_size,
+                    days_back=days_back,
+                    sort_by=sort_by,
+                    page=page,
+                    randomize_sources=randomize_sources,
+                    force_refresh=force_refresh
+                ))
+            
             # Fetch articles for each category in parallel
             tasks = []
             for cat in categories:
@@ -399,31 +1287,32 @@ class NewsFetcher:
                 )
             
             # Wait for all category fetches to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            except BaseException:
+                if newsapi_task:
+                    newsapi_task.cancel()
+                    # Wait for the cancellation so its request is torn down and its outcome retrieved
+                    await asyncio.gather(newsapi_task, return_exceptions=True)
+                raise
             
             # Combine results and filter out errors
             for result in results:
                 if isinstance(result, list):
                     all_articles.extend(result)
+            # Categories can share stories (e.g. business and politics)
+            all_articles = _dedupe_articles(all_articles)
             
             # Shuffle articles to mix categories
             random.shuffle(all_articles)
             
-            if len(all_articles) < page_size:
-                return await self.fetch_articles_async(
-                    query=query,
-                    category=category,
-                    language=language,
-                    page_size=page_size,
-                    days_back=days_back,
-                    sort_by=sort_by,
-                    page=page,
-                    use_rss=use_rss,
-                    discover_feeds=discover_feeds,
-                    randomize_sources=randomize_sources,
-                    force_refresh=force_refresh,
-                    use_rss_only=use_rss_only
-                )
+            if newsapi_task:
+                if len(all_articles) < page_size:
+                    # Not enough RSS articles, fall back to NewsAPI
+                    return await newsapi_task
+                # RSS was enough; drop the NewsAPI request if it is still running
+                newsapi_task.cancel()
+                await asyncio.gather(newsapi_task, return_exceptions=True)
             # Return the requested number of articles
             return all_articles[:page_size]
 
@@ -436,171 +1325,57 @@ class NewsFetcher:
         Fetch articles from RSS feeds and extract full content using async/await
         """
         try:
-            # Define a list of popular RSS feeds by category
-            rss_feeds = {
-                'technology': [
-                    'https://techcrunch.com/feed/',
-                    'https://www.theverge.com/rss/index.xml',
-                    'https://www.wired.com/feed/rss',
-                    'https://www.engadget.com/rss.xml',
-                    'https://www.zdnet.com/news/rss.xml',
-                    'https://www.techradar.com/rss',
-                    'https://www.digitaltrends.com/feed/',
-                    'https://www.techspot.com/feeds/',
-                    'https://www.techmeme.com/feed.xml',
-                    'https://www.techrepublic.com/rss/',
-                    'https://www.techdirt.com/feed/',
-                    'https://www.techworld.com/rss',
-                    'https://www.techhive.com/feed/',
-                    'https://www.techrepublic.com/rss/',
-                    'https://www.techspot.com/feeds/'
-                ],
-                'business': [
-                    'https://www.bloomberg.com/feeds/sitemap_news.xml',
-                    'https://www.reutersagency.com/feed/',
-                    'https://www.ft.com/rss/home',
-                    'https://www.wsj.com/xml/rss/3_7085.xml',
-                    'https://www.cnbc.com/id/100003114/device/rss/rss.html',
-                    'https://www.businessinsider.com/rss',
-                    'https://www.marketwatch.com/rss',
-                    'https://www.fool.com/feed/',
-                    'https://www.investors.com/feed/',
-                    'https://www.morningstar.com/rss',
-                    'https://www.barrons.com/rss',
-                    'https://www.fortune.com/feed/',
-                    'https://www.inc.com/rss',
-                    'https://www.fastcompany.com/feed',
-                    'https://www.entrepreneur.com/rss'
-                ],
-                'politics': [
-                    'https://www.politico.com/rss/politicopicks.xml',
-                    'https://www.theguardian.com/politics/rss',
-                    'https://www.nytimes.com/svc/collections/v1/publish/https://www.nytimes.com/section/politics/rss.xml',
-                    'https://www.washingtonpost.com/politics/feed/',
-                    'https://www.bbc.com/news/politics/rss.xml',
-                    'https://www.npr.org/rss/politics/',
-                    'https://www.cnn.com/politics/rss',
-                    'https://www.foxnews.com/politics/rss',
-                    'https://www.cbsnews.com/politics/rss/',
-                    'https://www.nbcnews.com/politics/rss',
-                    'https://www.abcnews.go.com/politics/rss',
-                    'https://www.politifact.com/rss/',
-                    'https://www.factcheck.org/feed/',
-                    'https://www.opensecrets.org/rss/',
-                    'https://www.rollcall.com/feed/'
-                ],
-                'entertainment': [
-                    'https://www.rollingstone.com/feed/',
-                    'https://www.variety.com/feed',
-                    'https://www.hollywoodreporter.com/feed',
-                    'https://www.ew.com/feed/',
-                    'https://www.billboard.com/feed/',
-                    'https://www.people.com/rss/',
-                    'https://www.eonline.com/feed',
-                    'https://www.usmagazine.com/feed/',
-                    'https://www.etonline.com/feed',
-                    'https://www.tmz.com/rss.xml',
-                    'https://www.entertainmentweekly.com/feed',
-                    'https://www.vulture.com/feed',
-                    'https://www.pitchfork.com/feed/',
-                    'https://www.spin.com/feed/',
-                    'https://www.stereogum.com/feed/'
-                ],
-                'sports': [
-                    'https://www.espn.com/espn/rss/news',
-                    'https://www.si.com/rss/si_topstories.xml',
-                    'https://www.skysports.com/rss/0,20514,11661,00.xml',
-                    'https://www.bbc.com/sport/rss.xml',
-                    'https://www.theguardian.com/sport/rss',
-                    'https://www.cbssports.com/rss/',
-                    'https://www.nbcsports.com/rss',
-                    'https://www.foxsports.com/rss',
-                    'https://www.sportingnews.com/rss',
-                    'https://www.bleacherreport.com/rss',
-                    'https://www.sportsillustrated.com/rss',
-                    'https://www.nfl.com/rss',
-                    'https://www.nba.com/rss',
-                    'https://www.mlb.com/rss',
-                    'https://www.nhl.com/rss'
-                ]
-            }
-
-            # Select feeds based on query or category
-            selected_feeds = []
-            if query:
-                # If query is a single word, treat it as a category
-                if ' ' not in query:
-                    category = query.lower()
+            # Select feeds based on query or category (falls back to a mix of feeds)
+            feeds = _resolve_feeds(query, category)
+            category = _resolve_category(query, category)
             
-            if category and category.lower() in rss_feeds:
-                selected_feeds.extend(rss_feeds[category.lower()])
-            else:
-                # If no category or query matches, use a mix of feeds
-                for feeds in rss_feeds.values():
-                    selected_feeds.extend(feeds[:2])  # Take first 2 feeds from each category
-
             # Shuffle feeds to get variety
-            random.shuffle(selected_feeds)
-            
-            # Create aiohttp session
-            session = await self._get_session()
+            selected_feeds = random.sample(feeds, k=min(len(feeds), 20))
+
+            # Fetch feeds in parallel, a bounded number at a time
+            semaphore = asyncio.Semaphore(_FEED_CONCURRENCY)
             
-            # Fetch feeds in parallel with timeout
             async def fetch_feed(feed_url: str) -> List[Dict]:
                 try:
-                    async with session.get(feed_url, timeout=5) as response:
-                        if response.status != 200:
-                            return []
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-                        if not feed.entries:
-                            return []
-                            
-                        articles = []
-                        for entry in feed.entries[:3]:  # Only process first 3 entries per feed
-                            title = entry.get('title', '')
-                            url = entry.get('link', '')
-                            if not title or not url:
-                                continue
-                                
-                            published = entry.get('published', '')
-                            source = feed.feed.get('title', 'Unknown Source')
-                            
-                            # Generate article ID
-                            article_id = f"{source}-{title}"[:50].replace(" ", "-").lower()
-                            url_hash = str(hash(url))[:8]
-                            article_id = f"{article_id}-{url_hash}"
-                            
-                            # Get initial content from RSS
-                            content = entry.get('summary', '')
-                            if not content and entry.get('content'):
-                                content = entry.get('content')[0].get('value', '')
-                            
-                            # Get initial image from RSS
-                            image_url = None
-                            if entry.get('media_content'):
-                                for media in entry.get('media_content', []):
-                                    if media.get('type', '').startswith('image/'):
-                                        image_url = media.get('url')
-                                        break
-                            elif entry.get('media_thumbnail'):
-                                image_url = entry.get('media_thumbnail', [{}])[0].get('url')
+                    # Only process first 3 entries per feed
+                    entries = await self._fetch_feed_entries(feed_url, semaphore, max_entries=3)
+                    if not entries:
+                        return []
+                        
+                    articles = []
+                    for entry in entries:
+                        title = entry['title']
+                        url = entry['link']
+                        if not title or not url:
+                            continue
                             
-                            if title and url and content:
-                                article_data = {
-                                    "article_id": article_id,
-                                    "title": title,
-                                    "content": content,
-                                    "source": source,
-                                    "url": url,
-                                    "published_at": published,
-                                    "image_url": image_url,
-                                    "category": category if category else "other"
-                                }
-                                articles.append(article_data)
-                        return articles
+                        published = entry['published']
+                        source = entry['source']
+                        
+                        # Generate article ID
+                        article_id = _slug(f"{source}-{title}")
+                        url_hash = self._short_id(url)
+                        article_id = f"{article_id}-{url_hash}"
+                        
+                        # Get initial content and image from RSS
+                        content = entry['summary']
+                        image_url = entry['media']
+                        
+                        if title and url and content:
+                            article_data = {
+                                "article_id": article_id,
+                                "title": title,
+                                "content": content,
+                                "source": source,
+                                "url": url,
+                                "published_at": published,
+                                "image_url": image_url,
+                                "category": category if category else "other"
+                            }
+                            articles.append(article_data)
+                    return articles
                 except Exception as e:
-                    logger.warning(f"Error fetching feed {feed_url}: {str(e)}")
+                    logger.warning("Error fetching feed %s: %s", feed_url, e)
                     return []
             
             # Fetch all feeds in parallel
@@ -613,12 +1388,15 @@ class NewsFetcher:
                 if isinstance(result, list):
                     all_articles.extend(result)
             
+            # Drop stories that appear in several feeds before paying for extraction
+            all_articles = _dedupe_articles(all_articles)
+            
             # Shuffle articles and select the ones we'll return
             random.shuffle(all_articles)
             selected_articles = all_articles[:page_size]
             
             # Extract full content and images only for the selected articles
-            logger.info(f"Extracting full content for {len(selected_articles)} articles...")
+            logger.info("Extracting full content for %d articles...", len(selected_articles))
             
             # Process articles in parallel with timeout
             async def process_article(article: Dict) -> Dict:
@@ -632,22 +1410,19 @@ class NewsFetcher:
                     if extracted.get('image_url'):
                         article['image_url'] = extracted['image_url']
                 except Exception as e:
-                    logger.warning(f"Error extracting content for {article['url']}: {str(e)}")
+                    logger.warning("Error extracting content for %s: %s", article['url'], e)
                 return article
             
-            # Process articles in parallel with timeout
-            tasks = [process_article(article) for article in selected_articles]
-            processed_articles = await asyncio.gather(*tasks, return_exceptions=True)
+            # Process articles in parallel with timeout, skipping ones the feed already filled in
+            tasks = [process_article(article) for article in selected_articles if _needs_extraction(article)]
+            await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Filter out errors and return valid articles
-            return [article for article in processed_articles if isinstance(article, dict)]
+            # Articles are updated in place, so the selection is the result
+            return selected_articles
                     
         except Exception as e:
-            logger.error(f"Error fetching articles from RSS: {str(e)}")
+            logger.error("Error fetching articles from RSS: %s", e)
             return []
-        finally:
-            # Close session
-            await self._close_session()
 
     async def _fetch_articles_from_newsapi(self,
                       query: Optional[str] = None,
@@ -663,25 +1438,24 @@ class NewsFetcher:
         Fetch articles from NewsAPI and extract their content
         """
         if not self.newsapi_key:
-            print("No NewsAPI key found")
+            logger.error("No NewsAPI key found")
             return []
 
         try:
-            print(f"Making NewsAPI request with query: {query}")
+            logger.info("Making NewsAPI request with query: %s", query)
             
-            # Calculate date range for fresh articles (last week)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=2)  # Get articles from the last 2 days
+            # Get articles from the last 2 days
+            start_iso, end_iso = _date_window(2, int(time.time() // 60))
             
             # Prepare API parameters
             params = {
                 'q': query,
                 'language': language,
-                'sort_by': sort_by,  # Python client expects 'sort_by'
-                'page_size': min(page_size, 100),  # Python client expects 'page_size'
+                'sortBy': sort_by,
+                'pageSize': min(page_size, 100),
                 'page': page,
-                'from_param': start_date.strftime('%Y-%m-%dT%H:%M:%S'),  # Python client expects 'from_param'
-                'to': end_date.strftime('%Y-%m-%dT%H:%M:%S')
+                'from': start_iso,
+                'to': end_iso
             }
             
             # Add random sources if requested
@@ -692,135 +1466,95 @@ class NewsFetcher:
             # Remove None values and empty strings
             params = {k: v for k, v in params.items() if v is not None and v != ''}
             
-            print(f"NewsAPI request params: {params}")
+            logger.debug("NewsAPI request params: %s", params)
             
-            # Use the NewsAPI client to fetch articles
-            response = self.newsapi.get_everything(**params)
+            # Fetch articles without blocking the event loop
+            response = await self._newsapi_everything(params)
             
-            print(f"NewsAPI response status: {response.get('status')}")
-            print(f"NewsAPI response totalResults: {response.get('totalResults')}")
+            logger.info("NewsAPI response status: %s", response.get('status'))
+            logger.info("NewsAPI response totalResults: %s", response.get('totalResults'))
             
             if response.get('status') != 'ok':
-                print(f"NewsAPI error: {response.get('message', 'Unknown error')}")
+                logger.error("NewsAPI error: %s", response.get('message', 'Unknown error'))
                 return []
             
             articles = response.get('articles', [])
-            print(f"Number of articles received: {len(articles)}")
+            logger.info("Number of articles received: %d", len(articles))
             
             if not articles:
-                print("No articles received from NewsAPI")
+                logger.warning("No articles received from NewsAPI")
                 return []
             
-            # Process articles
-            processed_articles = []
+            # Process articles into a presized list, trimmed once filled
+            records: List[Optional[ArticleRecord]] = [None] * len(articles)
+            needs_page = [False] * len(articles)
+            count = 0
             for article in articles:
                 # Get original article data
                 original_title = article.get('title', '')
-                original_description = article.get('description', '')
+                # Start from the description or the content, whichever says more
+                original_content, truncated = _best_api_text(article.get('description'), article.get('content'))
                 original_url = article.get('url', '')
                 original_source = article.get('source', {}).get('name', 'unknown')
                 original_image = article.get('urlToImage')
                 original_published = article.get('publishedAt')  # This is the reliable date from NewsAPI
                 
                 # Generate a unique article ID
-                article_id = f"{original_source}-{original_title}"[:50].replace(" ", "-").lower()
+                article_id = _slug(f"{original_source}-{original_title}")
                 if original_url:
-                    url_hash = str(hash(original_url))[:8]
+                    url_hash = self._short_id(original_url)
                     article_id = f"{article_id}-{url_hash}"
                 
                 # Only add articles that have both title and URL
                 if original_title and original_url:
-                    article_data = {
-                        "article_id": article_id,
-                        "title": original_title,
-                        "content": original_description,  # Use description as initial content
-                        "source": original_source,
-                        "url": original_url,
-                        "published_at": original_published,  # Use the NewsAPI date
-                        "image_url": original_image,
-                        "category": "other"  # Default category
-                    }
-                    processed_articles.append(article_data)
-            
-            print(f"Number of processed articles: {len(processed_articles)}")
-            
-            # Extract full content in parallel using ThreadPoolExecutor
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                futures = []
-                for article in processed_articles:
-                    if article.get('url'):
-                        futures.append(
-                            executor.submit(
-                                self._extract_article_content,
-                                article['url'],
-                                article.get('title', '')
-                            )
-                        )
-                
-                # Process results as they complete
-                for article, future in zip(processed_articles, futures):
-                    try:
-                        extracted_data = future.result(timeout=15)  # 15 second timeout per article
-                        if extracted_data.get('content'):
-                            # Keep the original published_at from NewsAPI
-                            original_published = article['published_at']
-                            article.update(extracted_data)
-                            article['published_at'] = original_published
-                    except Exception as e:
-                        print(f"Error processing article {article.get('url')}: {str(e)}")
+                    records[count] = ArticleRecord(
+                        article_id=article_id,
+                        title=original_title,
+                        content=original_content,
+                        source=original_source,
+                        url=original_url,
+                        published_at=original_published,  # Use the NewsAPI date
+                        image_url=original_image
+                    )
+                    # Only truncated or thin articles are worth a page download
+                    needs_page[count] = truncated or _needs_extraction(
+                        {'content': original_content, 'image_url': original_image}
+                    )
+                    count += 1
+            del records[count:]
             
-            return processed_articles[:page_size]
-                    
-        except Exception as e:
-            print(f"Error fetching articles from NewsAPI: {str(e)}")
-            return []
-
-    def _extract_article_content(self, url: str, original_title: str = "") -> Dict[str, str]:
-        """Synchronous version of article content extraction"""
-        try:
-            # print(f"Attempting to extract content from: {url}")
-            article = Article(url, config=self.newspaper_config)
-            article.download()
-            article.parse()
+            logger.info("Number of processed articles: %d", count)
             
-            # Only run NLP if we have content
-            if article.text:
+            # Extract full content concurrently on the event loop, sharing the aiohttp session
+            async def process_article(record: ArticleRecord, needs_page: bool) -> ArticleRecord:
+                if not needs_page:
+                    return record
                 try:
-                    article.nlp()  # This will extract keywords, summary, etc.
+                    extracted_data = await asyncio.wait_for(
+                        self._extract_article_content_async(record.url, record.title),
+                        timeout=15  # 15 second timeout per article
+                    )
+                    if extracted_data.get('content'):
+                        # Keep the original published_at from NewsAPI
+                        record.title = extracted_data['title']
+                        record.content = extracted_data['content']
+                        record.image_url = extracted_data['image_url']
+                        record.summary = extracted_data['summary']
+                        record.keywords = extracted_data['keywords']
                 except Exception as e:
-                    print(f"Warning: NLP processing failed: {str(e)}")
-            
-            # Log the extraction results
-            # print(f"Successfully extracted content from {url}")
-            # print(f"Title: {article.title}")
-            # print(f"Content length: {len(article.text)} characters")
+                    logger.warning("Error processing article %s: %s", record.url, e)
+                return record
             
-            # Only use extracted title if it's not empty and different from original
-            final_title = article.title if article.title and article.title != original_title else original_title
+            processed_records = await asyncio.gather(
+                *(process_article(record, needs_page[i]) for i, record in enumerate(records[:page_size]))
+            )
             
-            return {
-                "title": final_title,
-                "content": article.text,
-                "image_url": article.top_image,
-                "summary": article.summary if hasattr(article, 'summary') else "",
-                "keywords": article.keywords if hasattr(article, 'keywords') else []
-            }
-                
+            # Convert to plain dicts only at the API boundary
+            return [asdict(record) for record in processed_records]
+                    
         except Exception as e:
-            print(f"Error extracting article content from {url}: {str(e)}")
-            return {
-                "title": original_title,  # Keep the original title
-                "content": "",
-                "image_url": None,
-                "summary": "",
-                "keywords": []
-            }
-        finally:
-            # Ensure any open connections are closed
-            if hasattr(article, 'html') and article.html:
-                article.html = None
-            if hasattr(article, 'text') and article.text:
-                article.text = None
+            logger.error("Error fetching articles from NewsAPI: %s", e)
+            return []
 
     def _merge_article_data(self, api_data: Dict, extracted_data: Dict) -> Dict:
         """
@@ -841,37 +1575,75 @@ class NewsFetcher:
         return merged
         
     def _is_valid_rss_url(self, url: str) -> bool:
-        """Check if a URL is a valid RSS feed"""
+        """
+        Check if a URL is a valid RSS feed
+        Results are kept in memory and in the discovery cache for 24 hours
+        """
+        with self._valid_feed_lock:
+            memo = self._valid_feed_memo.get(url)
+            if memo is not None:
+                if memo[1] > time.time():
+                    self._valid_feed_memo.move_to_end(url)
+                    return memo[0]
+                del self._valid_feed_memo[url]  # Expired
+            
+        key = ('valid', url)
+        is_valid = self._discovery_cache.get(key)
+        if is_valid is None:
+            is_valid = self._probe_rss_url(url)
+            self._discovery_cache.set(key, is_valid, expire=_DISCOVERY_TTL)
+        with self._valid_feed_lock:
+            self._valid_feed_memo[url] = (is_valid, time.time() + _DISCOVERY_TTL)
+            self._valid_feed_memo.move_to_end(url)
+            if len(self._valid_feed_memo) > _VALID_FEED_MEMO_SIZE:
+                self._valid_feed_memo.popitem(last=False)
+        return is_valid
+            
+    def _probe_rss_url(self, url: str) -> bool:
+        """
+        Probe a URL over the network to see whether it serves a feed
+        Sniffs the Content-Type and the first bytes of the body instead of
+        downloading and parsing the whole feed
+        """
         try:
-            feed = feedparser.parse(url)
-            return feed.entries and feed.feed
-        except:
+            response = self.http.get(url, timeout=5, stream=True, headers=_FEED_SNIFF_HEADERS)
+            try:
+                if response.status_code not in (200, 206):
+                    return False
+                content_type = response.headers.get('Content-Type', '').lower()
+                if any(kind in content_type for kind in _FEED_CONTENT_TYPES):
+                    return True
+                # Headers alone rule out empty bodies and binary types (images, PDFs, ...),
+                # so those never download a byte; text/html still gets sniffed because
+                # some servers mislabel their feeds
+                if response.headers.get('Content-Length') == '0':
+                    return False
+                if content_type and not content_type.startswith('text/'):
+                    return False
+                head = response.raw.read(_FEED_SNIFF_BYTES, decode_content=True).lstrip().lower()
+                return any(marker in head for marker in _FEED_MARKERS)
+            finally:
+                response.close()
+        except (requests.RequestException, Urllib3Error) as e:
+            # Retryable statuses were already retried by the session's adapter
+            logger.debug("Feed probe failed for %s: %s", url, e)
             return False
             
     def _find_rss_links(self, url: str) -> List[str]:
         """Find RSS feed links on a webpage"""
         try:
-            response = requests.get(url, timeout=5)
+            response = self.http.get(url, timeout=5)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'lxml')
-            rss_links = []
-            
-            # Look for RSS feed links in various formats
-            for link in soup.find_all('link'):
-                if link.get('type') in ['application/rss+xml', 'application/atom+xml', 'application/xml']:
-                    href = link.get('href')
-                    if href:
-                        rss_links.append(urljoin(url, href))
+            # lxml decodes the bytes using the page's declared encoding
+            tree = lhtml.fromstring(response.content)
+            base = urlsplit(url)  # Parsed once for every link on the page
             
-            # Look for common RSS feed patterns in links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if any(pattern in href.lower() for pattern in ['rss', 'feed', 'atom', '.xml']):
-                    rss_links.append(urljoin(url, href))
-                    
-            return rss_links
-        except:
+            # Feed links in <link type="..."> tags, then <a> hrefs that look like feeds
+            hrefs = _RSS_LINK_XPATH(tree) + _RSS_ANCHOR_XPATH(tree)
+            return [_join_href(url, base, href) for href in hrefs if href]
+        except (requests.RequestException, etree.ParserError) as e:
+            logger.debug("Could not scan %s for feed links: %s", url, e)
             return []
             
     def _search_for_feeds(self, query: str, num_results: int = 5) -> List[str]:
@@ -879,20 +1651,21 @@ class NewsFetcher:
         try:
             # Use DuckDuckGo's HTML version for searching
             search_url = f"https://html.duckduckgo.com/html/?q={quote(query)}+rss+feed"
-            response = requests.get(search_url, timeout=5)
+            response = self.http.get(search_url, timeout=5)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'lxml')
+            # Hand over the raw bytes; lxml decodes them using the declared encoding
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_SEARCH_RESULT_STRAINER)
             results = []
             
-            # Extract search results
-            for result in soup.find_all('div', class_='result'):
-                link = result.find('a', class_='result__url')
-                if link and link.get('href'):
+            # Extract search results (only result links were parsed)
+            for link in soup.find_all('a'):
+                if link.get('href'):
                     results.append(link['href'])
                     
             return results[:num_results]
-        except:
+        except requests.RequestException as e:
+            logger.warning("Feed search failed for %r: %s", query, e)
             return []
             
     def discover_feeds(self, category: str, num_feeds: int = 5) -> Set[str]:
@@ -901,264 +1674,94 @@ class NewsFetcher:
         """
         if category in self.discovered_feeds:
             return self.discovered_feeds[category]
+        
+        # Reuse feeds discovered by a previous process within the TTL
+        cached_feeds = self._discovery_cache.get(('feeds', category))
+        if cached_feeds is not None:
+            self.discovered_feeds[category] = set(cached_feeds)
+            return self.discovered_feeds[category]
             
-        # Search for websites in the category
-        search_query = f"{category} news website"
-        websites = self._search_for_feeds(search_query)
+        # Start from the seed sites of known categories, searching only for the rest
+        websites = _SEED_SITES.get(category.lower()) or self._search_for_feeds(f"{category} news website")
         
         discovered_feeds = set()
-        for website in websites:
-            # Find RSS feeds on the website
-            rss_links = self._find_rss_links(website)
+        with ThreadPoolExecutor(max_workers=_DISCOVERY_WORKERS) as executor:
+            # Scan all websites at once; each scan queues validation of its links as
+            # soon as it finishes, so the slowest homepage doesn't hold up the rest
+            site_futures = {executor.submit(self._find_rss_links, website) for website in websites}
+            feed_futures = {}
+            seen_links = set()
+            pending = set(site_futures)
+            while pending and len(discovered_feeds) < num_feeds:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in site_futures:
+                        for feed_url in future.result():
+                            if feed_url not in seen_links:
+                                seen_links.add(feed_url)
+                                probe = executor.submit(self._is_valid_rss_url, feed_url)
+                                feed_futures[probe] = feed_url
+                                pending.add(probe)
+                    elif future.result():
+                        discovered_feeds.add(feed_futures[future])
             
-            # Validate and add feeds
-            for feed_url in rss_links:
-                if self._is_valid_rss_url(feed_url):
-                    discovered_feeds.add(feed_url)
-                    if len(discovered_feeds) >= num_feeds:
-                        break
-                        
-            if len(discovered_feeds) >= num_feeds:
-                break
+            # Drop scans and probes that haven't started yet
+            for future in pending:
+                future.cancel()
                 
         self.discovered_feeds[category] = discovered_feeds
+        self._discovery_cache.set(('feeds', category), sorted(discovered_feeds), expire=_DISCOVERY_TTL)
         return discovered_feeds
         
-    def _format_article(self, article: Dict, source: str = "newsdata") -> Dict:
-        """Format article data consistently regardless of source"""
-        if source == "newsdata":
-            # Generate a unique article ID
-            article_id = article.get("link", "").split("/")[-1]
-            if not article_id or len(article_id) < 5:  # If the URL doesn't provide a good ID
-                # Use a combination of source and title
-                source_name = article.get("source_id", "unknown")
-                title = article.get("title", "")
-                article_id = f"{source_name}-{title}"[:50].replace(" ", "-").lower()
-            
-            return {
-                "article_id": article_id,
-                "title": article.get("title", ""),
-                "content": article.get("content", ""),
-                "source": article.get("source_id", ""),
-                "url": article.get("link", ""),
-                "published_at": article.get("pubDate", ""),
-                "image_url": article.get("image_url", ""),
-                "category": article.get("category", ["other"])[0] if isinstance(article.get("category"), list) else article.get("category", "other")
-            }
-        else:  # RSS feed
-            # Try to extract image from RSS feed
-            image_url = None
-            
-            # First try media_content
-            if article.get("media_content"):
-                for media in article.get("media_content", []):
-                    if media.get("type", "").startswith("image/"):
-                        image_url = media.get("url")
-                        break
-            
-            # Then try media_thumbnail
-            elif article.get("media_thumbnail"):
-                image_url = article.get("media_thumbnail", [{}])[0].get("url")
-            
-            # Then try enclosures
-            elif article.get("enclosures"):
-                for enclosure in article.get("enclosures", []):
-                    if enclosure.get("type", "").startswith("image/"):
-                        image_url = enclosure.get("url")
-                        break
-            
-            # Then try to extract from summary
-            elif article.get("summary"):
-                try:
-                    soup = BeautifulSoup(article.get("summary", ""), 'lxml')
-                    img = soup.find('img')
-                    if img and img.get('src'):
-                        image_url = img['src']
-                except:
-                    pass
-            
-            # Get category and subcategory
-            category = article.get("category", "other")
-                
-            # Generate a unique article ID
-            article_id = article.get("link", "").split("/")[-1]
-            if not article_id or len(article_id) < 5:  # If the URL doesn't provide a good ID
-                # Use a combination of source and title
-                source_name = source
-                title = article.get("title", "")
-                article_id = f"{source_name}-{title}"[:50].replace(" ", "-").lower()
-            
-            # Get the full content
-            content = article.get("summary", "")
-            if not content:
-                content = article.get("description", "")
-            
-            return {
-                "article_id": article_id,
-                "title": article.get("title", ""),
-                "content": content,
-                "source": source,
-                "url": article.get("link", ""),
-                "published_at": article.get("published", ""),
-                "image_url": image_url,
-                "category": category
-            }
-            
     async def fetch_top_headlines(self, page_size: int = 10) -> List[Dict]:
         """
         Fetch top headlines from all category RSS feeds and return the most recent/popular articles.
         """
         articles = []
         seen_urls = set()
-        rss_feeds = {
-            'techn': [
-                    'https://techcrunch.com/feed/',
-                    'https://www.theverge.com/rss/index.xml',
-                    'https://www.wired.com/feed/rss',
-                    'https://www.engadget.com/rss.xml',
-                    'https://www.zdnet.com/news/rss.xml',
-                    'https://www.techradar.com/rss',
-                    'https://www.digitaltrends.com/feed/',
-                    'https://www.techspot.com/feeds/',
-                    'https://www.techmeme.com/feed.xml',
-                    'https://www.techrepublic.com/rss/',
-                    'https://www.techdirt.com/feed/',
-                    'https://www.techworld.com/rss',
-                    'https://www.techhive.com/feed/',
-                    'https://www.techrepublic.com/rss/',
-                    'https://www.techspot.com/feeds/'
-                ],
-                'business': [
-                    'https://www.bloomberg.com/feeds/sitemap_news.xml',
-                    'https://www.reutersagency.com/feed/',
-                    'https://www.ft.com/rss/home',
-                    'https://www.wsj.com/xml/rss/3_7085.xml',
-                    'https://www.cnbc.com/id/100003114/device/rss/rss.html',
-                    'https://www.businessinsider.com/rss',
-                    'https://www.marketwatch.com/rss',
-                    'https://www.fool.com/feed/',
-                    'https://www.investors.com/feed/',
-                    'https://www.morningstar.com/rss',
-                    'https://www.barrons.com/rss',
-                    'https://www.fortune.com/feed/',
-                    'https://www.inc.com/rss',
-                    'https://www.fastcompany.com/feed',
-                    'https://www.entrepreneur.com/rss'
-                ],
-                'politics': [
-                    'https://www.politico.com/rss/politicopicks.xml',
-                    'https://www.theguardian.com/politics/rss',
-                    'https://www.nytimes.com/svc/collections/v1/publish/https://www.nytimes.com/section/politics/rss.xml',
-                    'https://www.washingtonpost.com/politics/feed/',
-                    'https://www.bbc.com/news/politics/rss.xml',
-                    'https://www.npr.org/rss/politics/',
-                    'https://www.cnn.com/politics/rss',
-                    'https://www.foxnews.com/politics/rss',
-                    'https://www.cbsnews.com/politics/rss/',
-                    'https://www.nbcnews.com/politics/rss',
-                    'https://www.abcnews.go.com/politics/rss',
-                    'https://www.politifact.com/rss/',
-                    'https://www.factcheck.org/feed/',
-                    'https://www.opensecrets.org/rss/',
-                    'https://www.rollcall.com/feed/'
-                ],
-                'entertainment': [
-                    'https://www.rollingstone.com/feed/',
-                    'https://www.variety.com/feed',
-                    'https://www.hollywoodreporter.com/feed',
-                    'https://www.ew.com/feed/',
-                    'https://www.billboard.com/feed/',
-                    'https://www.people.com/rss/',
-                    'https://www.eonline.com/feed',
-                    'https://www.usmagazine.com/feed/',
-                    'https://www.etonline.com/feed',
-                    'https://www.tmz.com/rss.xml',
-                    'https://www.entertainmentweekly.com/feed',
-                    'https://www.vulture.com/feed',
-                    'https://www.pitchfork.com/feed/',
-                    'https://www.spin.com/feed/',
-                    'https://www.stereogum.com/feed/'
-                ],
-                'sport': [
-                    'https://www.espn.com/espn/rss/news',
-                    'https://www.si.com/rss/si_topstories.xml',
-                    'https://www.skysports.com/rss/0,20514,11661,00.xml',
-                    'https://www.bbc.com/sport/rss.xml',
-                    'https://www.theguardian.com/sport/rss',
-                    'https://www.cbssports.com/rss/',
-                    'https://www.nbcsports.com/rss',
-                    'https://www.foxsports.com/rss',
-                    'https://www.sportingnews.com/rss',
-                    'https://www.bleacherreport.com/rss',
-                    'https://www.sportsillustrated.com/rss',
-                    'https://www.nfl.com/rss',
-                    'https://www.nba.com/rss',
-                    'https://www.mlb.com/rss',
-                    'https://www.nhl.com/rss'
-                ],
-        }
 
-        # Create aiohttp session
-        session = await self._get_session()
+        # Fetch feeds in parallel, a bounded number at a time
+        semaphore = asyncio.Semaphore(_FEED_CONCURRENCY)
         
         async def fetch_feed(feed_url: str) -> List[Dict]:
             try:
-                async with session.get(feed_url, timeout=5) as response:
-                    if response.status != 200:
-                        return []
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-                    if not feed.entries:
-                        return []
-                        
-                    articles = []
-                    for entry in feed.entries[:3]:  # Only process first 3 entries per feed
-                        title = entry.get('title', '')
-                        url = entry.get('link', '')
-                        if not url or url in seen_urls:
-                            continue
-                        seen_urls.add(url)
-                        published = entry.get('published', '')
-                        source = feed.feed.get('title', 'Unknown Source')
-                        article_id = f"{source}-{title}"[:50].replace(" ", "-").lower()
-                        if url:
-                            url_hash = str(hash(url))[:8]
-                            article_id = f"{article_id}-{url_hash}"
-                        content = entry.get('summary', '')
-                        if not content and entry.get('content'):
-                            content = entry.get('content')[0].get('value', '')
-                        image_url = None
-                        if entry.get('media_content'):
-                            for media in entry.get('media_content', []):
-                                if media.get('type', '').startswith('image/'):
-                                    image_url = media.get('url')
-                                    break
-                        elif entry.get('media_thumbnail'):
-                            image_url = entry.get('media_thumbnail', [{}])[0].get('url')
-                        if title and url and content:
-                            article_data = {
-                                "article_id": article_id,
-                                "title": title,
-                                "content": content,
-                                "source": source,
-                                "url": url,
-                                "published_at": published,
-                                "image_url": image_url,
-                                "category": 'general'
-                            }
-                            articles.append(article_data)
-                    return articles
+                # Only process first 3 entries per feed
+                entries = await self._fetch_feed_entries(feed_url, semaphore, max_entries=3)
+                    
+                articles = []
+                for entry in entries:
+                    title = entry['title']
+                    url = entry['link']
+                    url_key = _canonical_url(url) if url else ''
+                    if not url_key or url_key in seen_urls:
+                        continue
+                    seen_urls.add(url_key)
+                    published = entry['published']
+                    source = entry['source']
+                    article_id = _slug(f"{source}-{title}")
+                    url_hash = self._short_id(url)
+                    article_id = f"{article_id}-{url_hash}"
+                    content = entry['summary']
+                    image_url = entry['media']
+                    if title and url and content:
+                        article_data = {
+                            "article_id": article_id,
+                            "title": title,
+                            "content": content,
+                            "source": source,
+                            "url": url,
+                            "published_at": published,
+                            "image_url": image_url,
+                            "category": 'general'
+                        }
+                        articles.append(article_data)
+                return articles
             except Exception as e:
-                logger.warning(f"Error fetching feed {feed_url}: {str(e)}")
+                logger.warning("Error fetching feed %s: %s", feed_url, e)
                 return []
 
-        # Collect all feed URLs
-        all_feeds = []
-        for feeds in rss_feeds.values():
-            all_feeds.extend(feeds)
-
         # Fetch all feeds in parallel
-        tasks = [fetch_feed(feed_url) for feed_url in all_feeds]
+        tasks = [fetch_feed(feed_url) for feeds in _RSS_FEEDS.values() for feed_url in feeds]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Combine results and filter out errors
@@ -1178,15 +1781,12 @@ class NewsFetcher:
                 if extracted.get('image_url'):
                     article['image_url'] = extracted['image_url']
             except Exception as e:
-                logger.warning(f"Error extracting content for {article['url']}: {str(e)}")
+                logger.warning("Error extracting content for %s: %s", article['url'], e)
             return article
 
-        # Process articles in parallel
-        tasks = [process_article(article) for article in articles]
-        processed_articles = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out errors
-        articles = [article for article in processed_articles if isinstance(article, dict)]
+        # Process articles in parallel, skipping ones the feed already filled in
+        tasks = [process_article(article) for article in articles if _needs_extraction(article)]
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         # Sort articles by publish date (descending)
         def parse_date(date_str):
@@ -1194,16 +1794,13 @@ class NewsFetcher:
             for fmt in ('%a, %d %b %Y %H:%M:%S %Z', '%Y-%m-%dT%H:%M:%SZ'):
                 try:
                     return datetime.strptime(date_str, fmt)
-                except Exception:
+                except (ValueError, TypeError):
                     continue
             return datetime.min
 
         articles.sort(key=lambda x: parse_date(x['published_at']), reverse=True)
         random.shuffle(articles)
         
-        # Close session
-        await self._close_session()
-        
         return articles[:page_size]
 
     def fetch_test_articles(self, 
@@ -1217,9 +1814,9 @@ class NewsFetcher:
         Ensures at least articles_per_category per category if possible.
         Prints a summary at the end.
         """
-        import requests
-        import time
         all_articles = []
+        # Timestamp used for entries whose published date cannot be parsed
+        fallback_iso = datetime.now(timezone.utc).isoformat()
         rss_feeds = {
             'tech': [
                 'https://techcrunch.com/feed/',
@@ -1284,6 +1881,13 @@ class NewsFetcher:
         }
         category_counts = {cat: 0 for cat in categories}
         feed_failures = {cat: [] for cat in categories}
+        # Download every category's feeds concurrently up front
+        feed_urls = [feed_url for category in categories for feed_url in rss_feeds.get(category, [])]
+        print(f"\nFetching {len(feed_urls)} feeds...")
+        start_time = time.time()
+        feed_results = dict(zip(feed_urls, self.run(self._fetch_feeds_async(feed_urls))))
+        print(f"Fetched feeds in {time.time() - start_time:.2f}s.")
+        
         for category in categories:
             print(f"\nFetching {category} articles...")
             feeds = rss_feeds.get(category, [])
@@ -1291,81 +1895,64 @@ class NewsFetcher:
             for feed_url in feeds:
                 if len(category_articles) >= articles_per_category:
                     break
-                print(f"  Fetching feed: {feed_url}")
-                try:
-                    start_time = time.time()
-                    resp = requests.get(feed_url, timeout=5)
-                    elapsed = time.time() - start_time
-                    if resp.status_code != 200:
-                        print(f"    Skipped (HTTP {resp.status_code})")
-                        feed_failures[category].append((feed_url, f"HTTP {resp.status_code}"))
-                        continue
-                    feed = feedparser.parse(resp.content)
-                    if not feed.entries:
-                        print("    No entries found.")
-                        feed_failures[category].append((feed_url, "No entries"))
-                        continue
-                    for entry in feed.entries:
-                        if len(category_articles) >= articles_per_category:
-                            break
-                        title = entry.get('title', '')
-                        url = entry.get('link', '')
-                        published = entry.get('published', '')
-                        source = feed.feed.get('title', 'Unknown Source')
-                        article_id = f"{source}-{title}"[:50].replace(" ", "-").lower()
-                        if url:
-                            url_hash = str(hash(url))[:8]
-                            article_id = f"{article_id}-{url_hash}"
-                        content = entry.get('summary', '')
-                        if not content and entry.get('content'):
-                            content = entry.get('content')[0].get('value', '')
-                        image_url = None
-                        if entry.get('media_content'):
-                            for media in entry.get('media_content', []):
-                                if media.get('type', '').startswith('image/'):
-                                    image_url = media.get('url')
-                                    break
-                        elif entry.get('media_thumbnail'):
-                            image_url = entry.get('media_thumbnail', [{}])[0].get('url')
-                        if title and url and content:
-                            article_data = {
-                                "article_id": article_id,
-                                "title": title,
-                                "content": content,
-                                "source": source,
-                                "url": url,
-                                "published_at": published,
-                                "image_url": image_url,
-                                "category": category,
-                                "confidence": round(random.uniform(0.85, 0.99), 2)
-                            }
-                            # Ensure published_at is timezone-aware
-                            if "published_at" in article_data:
-                                try:
-                                    dt = datetime.fromisoformat(article_data["published_at"].replace('Z', '+00:00'))
-                                    if dt.tzinfo is None:
-                                        dt = dt.replace(tzinfo=timezone.utc)
-                                    article_data["published_at"] = dt.isoformat()
-                                except (ValueError, AttributeError):
-                                    article_data["published_at"] = datetime.now(timezone.utc).isoformat()
-                            category_articles.append(article_data)
-                    print(f"    Got {len(feed.entries)} entries in {elapsed:.2f}s.")
-                except Exception as e:
-                    print(f"    Skipped (error: {str(e)})")
-                    feed_failures[category].append((feed_url, str(e)))
+                print(f"  Feed: {feed_url}")
+                entries = feed_results[feed_url]
+                if isinstance(entries, Exception):
+                    print(f"    Skipped (error: {str(entries)})")
+                    feed_failures[category].append((feed_url, str(entries)))
+                    continue
+                if not entries:
+                    print("    No entries found (or HTTP error).")
+                    feed_failures[category].append((feed_url, "No entries"))
                     continue
+                for entry in entries:
+                    if len(category_articles) >= articles_per_category:
+                        break
+                    title = entry['title']
+                    url = entry['link']
+                    published = entry['published']
+                    source = entry['source']
+                    article_id = _slug(f"{source}-{title}")
+                    if url:
+                        url_hash = self._short_id(url)
+                        article_id = f"{article_id}-{url_hash}"
+                    content = entry['summary']
+                    image_url = entry['media']
+                    if title and url and content:
+                        article_data = {
+                            "article_id": article_id,
+                            "title": title,
+                            "content": content,
+                            "source": source,
+                            "url": url,
+                            "published_at": published,
+                            "image_url": image_url,
+                            "category": category,
+                            "confidence": round(random.uniform(0.85, 0.99), 2)
+                        }
+                        # Ensure published_at is timezone-aware
+                        if "published_at" in article_data:
+                            try:
+                                dt = datetime.fromisoformat(article_data["published_at"].replace('Z', '+00:00'))
+                                if dt.tzinfo is None:
+                                    dt = dt.replace(tzinfo=timezone.utc)
+                                article_data["published_at"] = dt.isoformat()
+                            except (ValueError, AttributeError):
+                                article_data["published_at"] = fallback_iso
+                        category_articles.append(article_data)
+                print(f"    Got {len(entries)} entries.")
             # Shuffle and select up to articles_per_category
             random.shuffle(category_articles)
             all_articles.extend(category_articles[:articles_per_category])
             category_counts[category] = len(category_articles[:articles_per_category])
         # Fetch general articles (optional, can be skipped for speed)
         print("\nFetching general articles...")
-        general_articles = self.fetch_articles(
+        general_articles = self.run(self.fetch_articles(
             query="__GENERAL__",
             page_size=articles_per_category,
             use_rss_only=use_rss_only,
             force_refresh=True
-        )
+        ))
         for article in general_articles:
             article["category"] = "general"
             article["confidence"] = round(random.uniform(0.85, 0.99), 2)
@@ -1376,7 +1963,7 @@ class NewsFetcher:
                         dt = dt.replace(tzinfo=timezone.utc)
                     article["published_at"] = dt.isoformat()
                 except (ValueError, AttributeError):
-                    article["published_at"] = datetime.now(timezone.utc).isoformat()
+                    article["published_at"] = fallback_iso
             all_articles.append(article)
         # Print summary
         print("\n=== Fetch Summary ===")
@@ -1400,38 +1987,38 @@ class NewsFetcher:
         try:
             with Timer(f"Fetching RSS feed: {feed_url}"):
                 session = await self._get_session()
-                async with session.get(feed_url, timeout=10) as response:
+                async with session.get(feed_url) as response:
                     if response.status != 200:
-                        logger.error(f"Failed to fetch RSS feed: {feed_url}")
+                        logger.error("Failed to fetch RSS feed: %s", feed_url)
                         return []
                         
-                    content = await response.text()
-                    feed = feedparser.parse(content)
+                    entries = _parse_feed_fast(await response.read(), 'Unknown Source')
                     
-                    if not feed.entries:
-                        logger.warning(f"No entries found in RSS feed: {feed_url}")
-                        return []
-                        
-                    articles = []
-                    for entry in feed.entries:
-                        # Extract basic article information
-                        article = {
-                            "title": entry.get('title', ''),
-                            "url": entry.get('link', ''),
-                            "published_at": entry.get('published', datetime.now().isoformat()),
-                            "source": feed.feed.get('title', 'Unknown Source'),
-                            "description": entry.get('description', '')
-                        }
-                        
-                        # Only process articles with valid URLs
-                        if article['url']:
-                            articles.append(article)
+                if not entries:
+                    logger.warning("No entries found in RSS feed: %s", feed_url)
+                    return []
                     
-                    # Extract full content in parallel
-                    return await self._extract_articles_parallel_async(articles)
+                articles = []
+                now_iso = datetime.now(timezone.utc).isoformat()
+                for entry in entries:
+                    # Extract basic article information
+                    article = {
+                        "title": entry['title'],
+                        "url": entry['link'],
+                        "published_at": entry['published'] or now_iso,
+                        "source": entry['source'],
+                        "description": entry['summary']
+                    }
+                    
+                    # Only process articles with valid URLs
+                    if article['url']:
+                        articles.append(article)
+                
+                # Extract full content in parallel
+                return await self._extract_articles_parallel_async(articles)
                     
         except Exception as e:
-            logger.error(f"Error fetching RSS feed {feed_url}: {str(e)}")
+            logger.error("Error fetching RSS feed %s: %s", feed_url, e)
             return []
 
     async def discover_rss_feeds_async(self, url: str) -> Set[str]:
@@ -1445,27 +2032,19 @@ class NewsFetcher:
         try:
             with Timer(f"Discovering RSS feeds from: {url}"):
                 session = await self._get_session()
-                async with session.get(url, timeout=10) as response:
+                async with session.get(url) as response:
                     if response.status != 200:
                         return set()
                         
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Look for RSS feed links
-                    feeds = set()
-                    for link in soup.find_all('link'):
-                        if link.get('type') in ['application/rss+xml', 'application/atom+xml']:
-                            feed_url = link.get('href')
-                            if feed_url:
-                                # Convert relative URLs to absolute
-                                feed_url = urljoin(url, feed_url)
-                                feeds.add(feed_url)
+                    # lxml decodes the bytes using the page's declared encoding
+                    tree = lhtml.fromstring(await response.read())
+                    base = urlsplit(url)
                     
-                    return feeds
+                    # Look for RSS feed links, converting relative URLs to absolute
+                    return {_join_href(url, base, href) for href in _RSS_LINK_XPATH(tree) if href}
                     
         except Exception as e:
-            logger.error(f"Error discovering RSS feeds from {url}: {str(e)}")
+            logger.error("Error discovering RSS feeds from %s: %s", url, e)
             return set()
 
     async def fetch_articles_from_multiple_sources_async(self,
@@ -1503,21 +2082,13 @@ class NewsFetcher:
                         articles = await self.fetch_articles_from_rss_async(feed_url)
                         rss_articles.extend(articles)
                 
-                # Combine and deduplicate articles
-                all_articles = newsapi_articles + rss_articles
-                seen_urls = set()
-                unique_articles = []
-                
-                for article in all_articles:
-                    url = article.get('url')
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        unique_articles.append(article)
+                # Combine and deduplicate articles, NewsAPI copies win
+                unique_articles = _dedupe_articles(newsapi_articles + rss_articles)
                 
                 return unique_articles[:page_size]
                 
         except Exception as e:
-            logger.error(f"Error fetching from multiple sources: {str(e)}")
+            logger.error("Error fetching from multiple sources: %s", e)
             return []
 
     async def update_feed_discovery_async(self, category: str):
@@ -1544,8 +2115,24 @@ class NewsFetcher:
                         self.discovered_feeds[category].update(feeds)
                         
         except Exception as e:
-            logger.error(f"Error updating feed discovery: {str(e)}")
+            logger.error("Error updating feed discovery: %s", e)
 
     async def cleanup(self):
         """Clean up resources and close connections"""
-        await self._close_session() 
\ No newline at end of file
+        await self._close_session()
+        
+    def run(self, coro):
+        """
+        Run a coroutine to completion in a new event loop, for synchronous callers
+        The aiohttp session is bound to that loop, so it is closed before the loop ends
+        Args:
+            coro: Coroutine using this fetcher, e.g. fetch_articles(...)
+        Returns:
+            The coroutine's result
+        """
+        async def run_and_cleanup():
+            try:
+                return await coro
+            finally:
+                await self.cleanup()
+        return asyncio.run(run_and_cleanup()) 
\ No newline at end of file
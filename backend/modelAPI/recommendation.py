@@ -25,20 +25,89 @@ Note: This system balances between user preferences and article quality
 while maintaining diversity in recommendations.
 """
 
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Iterator, Iterable
 import numpy as np
 from collections import defaultdict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from dataclasses import dataclass, field
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from datetime import datetime, timezone
+import heapq
+import itertools
 import logging
-from functools import lru_cache
+import math
+import time
 import json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Hashed feature space for article text (unigrams and bigrams)
+_HASH_FEATURES = 2 ** 15
+
+# Articles added between refits of the IDF weights
+_IDF_REFIT_INTERVAL = 100
+
+# Lowest score an article can have and still be recommended; anything at or below
+# zero shares no terms with the user's profile
+_MIN_SCORE_FLOOR = 1e-6
+
+def _rank_rows(scores: np.ndarray, rows: np.ndarray, head: int) -> Iterator[int]:
+    """
+    Yield rows in descending score order without sorting every row up front
+    The best `head` rows are found with argpartition and sorted; the remainder
+    is only sorted if the caller keeps iterating past them
+    Args:
+        scores: Score of every row
+        rows: Rows to rank
+        head: Number of rows to rank eagerly
+    """
+    if head < rows.size:
+        order = np.argpartition(-scores[rows], head - 1)
+        top, rest = rows[order[:head]], rows[order[head:]]
+    else:
+        top, rest = rows, rows[:0]
+    yield from top[np.argsort(-scores[top], kind='stable')]
+    yield from rest[np.argsort(-scores[rest], kind='stable')]
+
+def _interleave_by_source(ranked: Iterable["Article"], limit: int) -> List["Article"]:
+    """
+    Pick up to `limit` articles, taking each source's best article before any
+    source's second best
+    Args:
+        ranked: Articles in descending order of preference
+        limit: Maximum number of articles to return
+    Returns:
+        Articles interleaved across sources, best first within each round
+    """
+    by_source: Dict[str, List["Article"]] = {}
+    for article in ranked:
+        by_source.setdefault(article.source, []).append(article)
+    
+    picked = []
+    for round_ in itertools.zip_longest(*by_source.values()):
+        for article in round_:
+            if article is None:
+                continue
+            if len(picked) >= limit:
+                return picked
+            picked.append(article)
+    return picked
+
+
+class PrefEntry:
+    """
+    Interaction statistics for one category of a user's reading history
+    Slotted: one small fixed-layout object per category instead of a dict
+    """
+    __slots__ = ("count", "total_confidence", "last_interaction")
+    
+    def __init__(self):
+        self.count = 0
+        self.total_confidence = 0.0
+        self.last_interaction: Optional[float] = None  # POSIX timestamp of the latest interaction
+
 class UserPreferences:
     """
     Manages user preferences and reading history
@@ -46,92 +115,121 @@ class UserPreferences:
     """
     def __init__(self):
         # Initialize preference tracking with default values
-        self.preferences = defaultdict(lambda: {
-            "count": 0, 
-            "total_confidence": 0,
-            "last_interaction": None,
-            "categories": defaultdict(float)
-        })
+        self.preferences: Dict[str, PrefEntry] = defaultdict(PrefEntry)
         self.read_articles = set()  # Set for O(1) lookup of read articles
-        self.category_weights = defaultdict(float)  # Weights for different categories
+        self.total_interactions = 0  # Interactions across all categories
+        # Running sum of the read articles' TF-IDF vectors; the profile is their mean
+        self.profile_sum: Optional[np.ndarray] = None
+        self.profile_count = 0
+        # Reads of articles that had no vector yet (article_id -> weight), folded
+        # into the profile once the article is added and vectorized
+        self.pending_reads: Dict[str, float] = {}
+        # Reads already in the profile (article_id -> weight), kept so it can be rebuilt
+        self.profile_reads: Dict[str, float] = {}
+        # RecommendationSystem._vectors_version the profile was built against
+        self.profile_version = 0
     
-    def update_preferences(self, category: str, confidence: float, article_id: str):
+    def update_preferences(self, category: str, confidence: float, article_id: str, weight: float = 1.0):
         """
         Update user preferences with time tracking and category weighting
         Args:
             category: Article category
             confidence: Classification confidence
             article_id: Unique article identifier
+            weight: How many interactions this read counts as
         """
-        try:
-            if article_id in self.read_articles:
-                return  # Prevent duplicate updates
-                
-            # Update preference statistics
-            self.preferences[category]["count"] += 1
-            self.preferences[category]["total_confidence"] += confidence
-            self.preferences[category]["last_interaction"] = datetime.now(timezone.utc).isoformat()
-            self.read_articles.add(article_id)
+        if article_id in self.read_articles:
+            return  # Prevent duplicate updates
             
-            # Update category weights based on interaction frequency
-            total_interactions = sum(pref["count"] for pref in self.preferences.values())
-            if total_interactions > 0:  # Prevent division by zero
-                for cat, pref in self.preferences.items():
-                    self.category_weights[cat] = pref["count"] / total_interactions
-                
-        except Exception as e:
-            logger.error(f"Error updating preferences: {str(e)}")
+        # Update preference statistics
+        entry = self.preferences[category]
+        entry.count += weight
+        entry.total_confidence += confidence * weight
+        entry.last_interaction = time.time()
+        self.read_articles.add(article_id)
+        self.total_interactions += weight
+    
+    def add_to_profile(self, vector: np.ndarray, weight: float = 1.0):
+        """
+        Fold a read article's TF-IDF vector into the running profile
+        Args:
+            vector: Dense TF-IDF vector of the article
+            weight: Weight of the article in the profile's mean
+        """
+        if self.profile_sum is None:
+            self.profile_sum = vector * np.float32(weight)
+        else:
+            self.profile_sum += vector * np.float32(weight)
+        self.profile_count += weight
     
+    def reset_profile(self, version: int):
+        """
+        Drop the profile vectors, queueing their reads to be folded in again
+        Args:
+            version: Vectors version the rebuilt profile will belong to
+        """
+        self.pending_reads.update(self.profile_reads)
+        self.profile_reads = {}
+        self.profile_sum = None
+        self.profile_count = 0
+        self.profile_version = version
+        
     def get_average_preferences(self) -> Dict[str, float]:
         """
         Calculate weighted average preferences considering recency
         Returns:
             Dictionary mapping categories to weighted preference scores
         """
-        try:
-            preferences = {}
-            for category, data in self.preferences.items():
-                if data["count"] > 0:
-                    # Calculate time decay factor
-                    last_interaction = datetime.fromisoformat(data["last_interaction"]) if data["last_interaction"] else datetime.now(timezone.utc)
-                    if last_interaction.tzinfo is None:
-                        last_interaction = last_interaction.replace(tzinfo=timezone.utc)
-                    time_diff = (datetime.now(timezone.utc) - last_interaction).days
-                    time_decay = np.exp(-0.1 * time_diff)  # Exponential decay
-                    
-                    # Calculate weighted preference score
-                    base_preference = data["total_confidence"] / data["count"]
-                    preferences[category] = base_preference * time_decay * self.category_weights.get(category, 1.0)
-                    
-            return preferences
-        except Exception as e:
-            logger.error(f"Error calculating preferences: {str(e)}")
-            return {}
+        preferences = {}
+        now = time.time()
+        for category, data in self.preferences.items():
+            if data.count > 0:
+                # Calculate time decay factor from whole days since the last interaction
+                last_interaction = data.last_interaction or now
+                time_diff = (now - last_interaction) // 86400
+                time_decay = math.exp(-0.1 * time_diff)  # Exponential decay
+                
+                # Calculate weighted preference score
+                base_preference = data.total_confidence / data.count
+                # Category weight based on interaction frequency
+                category_weight = data.count / self.total_interactions
+                preferences[category] = base_preference * time_decay * category_weight
+                
+        return preferences
 
+@dataclass(slots=True, eq=False)  # Compared and hashed by identity
 class Article:
     """
-    Represents a news article with metadata and vector representation
+    Represents a news article with metadata
+    Its TF-IDF vector lives in RecommendationSystem.article_vectors
+    Slotted so the up to 1000 stored articles don't each carry a __dict__
     """
-    def __init__(self, article_id: str, title: str, content: str, category: str, confidence: float, source: str, url: str, published_at: str, image_url: str):
-        self.article_id = article_id
-        self.title = title
-        self.content = content
-        self.category = category
-        self.confidence = confidence
-        self.source = source
-        self.url = url
-        self.published_at = published_at
-        self.image_url = image_url
-        self.vector = None  # TF-IDF vector representation
-        
+    article_id: str
+    title: str
+    content: str
+    category: str
+    confidence: float
+    source: str
+    url: str
+    published_at: str
+    image_url: str
+    subcategory: Optional[str] = None
+    # Derived from published_at in __post_init__
+    published_datetime: datetime = field(init=False, repr=False)
+    published_ts: float = field(init=False, repr=False)
+    
+    def __post_init__(self):
         # Parse published_at to timezone-aware datetime
         try:
-            dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+            dt = datetime.fromisoformat(self.published_at.replace('Z', '+00:00'))
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
             self.published_datetime = dt
-        except:
+        except (ValueError, AttributeError):
+            # Missing or unparseable date: treat the article as just published
             self.published_datetime = datetime.now(timezone.utc)
+        # Unix seconds, for sorting and time decay without datetime arithmetic
+        self.published_ts = self.published_datetime.timestamp()
 
 class RecommendationSystem:
     """
@@ -139,17 +237,37 @@ class RecommendationSystem:
     with diversity awareness and user preference tracking
     """
     def __init__(self, cache_size: int = 1000):
-        self.articles: Dict[str, Article] = {}  # Article storage
+        self.articles: Dict[str, Article] = {}  # Article storage, in insertion order
         self.user_preferences: Dict[str, UserPreferences] = defaultdict(UserPreferences)  # User preference tracking
-        self.vectorizer = TfidfVectorizer(
+        # Stateless hashing vectorizer: each article is tokenized once, on insertion,
+        # and IDF weights are refit from the stored term counts every so often
+        self.vectorizer = HashingVectorizer(
             stop_words='english',
-            max_features=5000,
-            ngram_range=(1, 2)  # Include bigrams for better context
+            n_features=_HASH_FEATURES,
+            ngram_range=(1, 2),  # Include bigrams for better context
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32  # Halves the memory traffic of the scoring mat-vec
         )
+        self.tfidf = TfidfTransformer(norm='l2')  # Unit rows: cosine similarity is a dot product
+        self.term_counts = None  # Raw term counts for all articles, one row each
         self.article_vectors = None  # TF-IDF vectors for all articles
-        self.article_ids = []  # Ordered list of article IDs
-        self.source_diversity = defaultdict(int)  # Track source diversity
-        self.is_vectorizer_fitted = False  # Track vectorizer state
+        # Per-row metadata aligned with the rows of article_vectors, for vectorized scoring
+        self._row_ids: List[str] = []
+        self._row_index: Dict[str, int] = {}
+        self._row_sources = np.empty(0, dtype=np.int32)  # Source id of each row
+        self._row_categories = np.empty(0, dtype=np.int32)  # Category id of each row
+        self._published_ts = np.empty(0, dtype=np.float64)
+        # Sources and categories are encoded as small integer ids so per-row
+        # factors are array lookups rather than dict lookups
+        self._source_ids: Dict[str, int] = {}
+        self._category_ids: Dict[str, int] = {}
+        self.source_diversity = np.zeros(0, dtype=np.int64)  # Articles seen per source id
+        self._inserts_since_refit = 0  # Articles vectorized with the current IDF weights
+        # Bumped whenever existing vectors change (IDF refit) or rows are evicted,
+        # so user profiles built from the old vectors are rebuilt
+        self._vectors_version = 0
+        self._pending_articles: List[Article] = []  # Added but not yet vectorized
         
     def add_article(self, article: Article):
         """
@@ -157,112 +275,155 @@ class RecommendationSystem:
         Args:
             article: Article object to add
         """
+        self.add_articles([article])
+    
+    def add_articles(self, articles: Iterable[Article]):
+        """
+        Add several articles to the system at once, with cache management
+        Args:
+            articles: Article objects to add; a later duplicate ID replaces an earlier one
+        """
         try:
-            # Remove oldest articles if cache is full
-            if len(self.articles) >= 1000:
-                oldest_articles = sorted(
-                    self.articles.values(), 
-                    key=lambda x: x.published_datetime
-                )[:100]  # Remove oldest 100 articles
-                for old_article in oldest_articles:
-                    self.articles.pop(old_article.article_id)
-                    self.article_ids.remove(old_article.article_id)
+            batch = {article.article_id: article for article in articles}
+            if not batch:
+                return
+                
+            # A re-added article replaces its old row
+            replaced = [article_id for article_id in batch if article_id in self.articles]
+            if replaced:
+                self._remove_articles(replaced)
             
-            # Add new article
-            self.articles[article.article_id] = article
-            self.article_ids.append(article.article_id)
-            self.source_diversity[article.source] += 1
+            # Add new articles
+            self.articles.update(batch)
+            source_ids = [
+                self._source_ids.setdefault(article.source, len(self._source_ids))
+                for article in batch.values()
+            ]
+            if len(self._source_ids) > len(self.source_diversity):
+                self.source_diversity = np.pad(
+                    self.source_diversity, (0, len(self._source_ids) - len(self.source_diversity))
+                )
+            np.add.at(self.source_diversity, source_ids, 1)
             
-            # Update TF-IDF vectors
-            self._update_vectors()
+            # Queue the articles; they are vectorized together when needed
+            self._pending_articles.extend(batch.values())
+            
+            # Remove oldest articles, 100 at a time, if the cache is over its limit
+            overflow = len(self.articles) - 1000
+            if overflow > 0:
+                oldest_articles = heapq.nsmallest(
+                    -(-overflow // 100) * 100,
+                    self.articles.values(),
+                    key=lambda x: x.published_ts
+                )
+                self._remove_articles([old_article.article_id for old_article in oldest_articles])
             
         except Exception as e:
-            logger.error(f"Error adding article: {str(e)}")
+            logger.error("Error adding articles: %s", e)
+            
+    def _remove_articles(self, article_ids: List[str]):
+        """
+        Remove articles and their vector rows
+        Args:
+            article_ids: IDs of the articles to remove
+        """
+        removed = set(article_ids)
+        for article_id in removed:
+            self.articles.pop(article_id, None)
+        self._pending_articles = [article for article in self._pending_articles if article.article_id not in removed]
+        
+        rows = [self._row_index[article_id] for article_id in removed if article_id in self._row_index]
+        if not rows:
+            return
+        keep = np.ones(len(self._row_ids), dtype=bool)
+        keep[rows] = False
+        self._vectors_version += 1
+        self.term_counts = self.term_counts[keep]
+        self.article_vectors = self.article_vectors[keep]
+        self._row_sources = self._row_sources[keep]
+        self._row_categories = self._row_categories[keep]
+        self._published_ts = self._published_ts[keep]
+        self._row_ids = [article_id for article_id in self._row_ids if article_id not in removed]
+        self._row_index = {article_id: i for i, article_id in enumerate(self._row_ids)}
     
-    @lru_cache(maxsize=100)
     def _calculate_article_similarity(self, article_id1: str, article_id2: str) -> float:
         """
-        Calculate cosine similarity between two articles with caching
+        Calculate cosine similarity between two articles
+        Not memoized: rows change whenever the IDF weights are refit, and a sparse
+        row dot product is cheap enough to recompute
         Args:
             article_id1: First article ID
             article_id2: Second article ID
         Returns:
             Similarity score between 0 and 1
         """
-        try:
-            if not (article_id1 in self.articles and article_id2 in self.articles):
-                return 0.0
-                
-            vec1 = self.articles[article_id1].vector
-            vec2 = self.articles[article_id2].vector
-            
-            if vec1 is None or vec2 is None:
-                return 0.0
-                
-            return float(cosine_similarity(vec1, vec2)[0][0])
-        except Exception as e:
-            logger.error(f"Error calculating article similarity: {str(e)}")
+        self._update_vectors()
+        row1 = self._row_index.get(article_id1)
+        row2 = self._row_index.get(article_id2)
+        if row1 is None or row2 is None:
             return 0.0
+            
+        # Rows are L2-normalized, so the dot product is the cosine similarity
+        return float(self.article_vectors[row1].multiply(self.article_vectors[row2]).sum())
     
     def _update_vectors(self):
         """
-        Update TF-IDF vectors for all articles
-        Handles vectorizer fitting and transformation
+        Vectorize the articles added since the last call
+        Adding an article only queues it; the queue is tokenized in one batch and
+        stacked onto the matrices the next time vectors are needed, and the IDF
+        weights are refit from the stored term counts every _IDF_REFIT_INTERVAL
+        insertions
         """
-        try:
-            if not self.articles:
-                return
-                
-            # Prepare documents for vectorization
-            documents = []
-            valid_article_ids = []
-            for article_id in self.article_ids:
-                article = self.articles[article_id]
-                # Combine title, category, and content for better representation
-                doc = f"{article.title} {article.category} {article.content}"
-                if doc.strip():  # Only add non-empty documents
-                    documents.append(doc)
-                    valid_article_ids.append(article_id)
-            
-            if not documents:
-                logger.warning("No valid documents to vectorize")
-                return
-            
-            try:
-                if not self.is_vectorizer_fitted:
-                    # First time fitting the vectorizer
-                    vectors = self.vectorizer.fit_transform(documents)
-                    self.is_vectorizer_fitted = True
-                else:
-                    # Transform new documents using existing vocabulary
-                    vectors = self.vectorizer.transform(documents)
-                
-                # Convert to dense array for easier manipulation
-                dense_vectors = vectors.toarray()
-                
-                # Store vectors in Article objects
-                for i, article_id in enumerate(valid_article_ids):
-                    if i < dense_vectors.shape[0]:  # Ensure index is within bounds
-                        self.articles[article_id].vector = dense_vectors[i].reshape(1, -1)
-                
-                self.article_vectors = vectors
-                
-            except Exception as e:
-                logger.error(f"Error in vectorization: {str(e)}")
-                # Reset vectorizer if there's an error
-                self.is_vectorizer_fitted = False
-                self.vectorizer = TfidfVectorizer(
-                    stop_words='english',
-                    max_features=5000,
-                    ngram_range=(1, 2)
-                )
-                
-        except Exception as e:
-            logger.error(f"Error updating vectors: {str(e)}")
-            # Reset vectorizer state
-            self.is_vectorizer_fitted = False
+        if not self._pending_articles:
+            return
+        pending, self._pending_articles = self._pending_articles, []
+        
+        # Combine title, category, and content for better representation
+        articles, documents = [], []
+        for article in pending:
+            doc = f"{article.title} {article.category} {article.content}"
+            if doc.strip():  # Only vectorize non-empty documents
+                articles.append(article)
+                documents.append(doc)
+            else:
+                logger.warning("No valid document to vectorize for %s", article.article_id)
+        if not documents:
+            return
+        
+        counts = self.vectorizer.transform(documents)
+        if self.term_counts is None:
+            self.term_counts = counts
+        else:
+            self.term_counts = sparse.vstack([self.term_counts, counts], format='csr')
+        
+        # Row-aligned metadata used by get_recommendations
+        for article in articles:
+            self._row_index[article.article_id] = len(self._row_ids)
+            self._row_ids.append(article.article_id)
+        self._row_sources = np.concatenate([
+            self._row_sources,
+            np.array([self._source_ids[article.source] for article in articles], dtype=np.int32)
+        ])
+        self._row_categories = np.concatenate([
+            self._row_categories,
+            np.array([self._category_ids.setdefault(article.category, len(self._category_ids)) for article in articles], dtype=np.int32)
+        ])
+        self._published_ts = np.concatenate([
+            self._published_ts,
+            np.array([article.published_ts for article in articles])
+        ])
+        
+        self._inserts_since_refit += len(articles)
+        if self.article_vectors is None or self._inserts_since_refit >= _IDF_REFIT_INTERVAL:
+            # Refresh the IDF weights from every stored article
+            self.article_vectors = self.tfidf.fit_transform(self.term_counts).astype(np.float32, copy=False)
+            self._inserts_since_refit = 0
+            self._vectors_version += 1
+        else:
+            vectors = self.tfidf.transform(counts).astype(np.float32, copy=False)
+            self.article_vectors = sparse.vstack([self.article_vectors, vectors], format='csr')
     
-    def update_user_preferences(self, user_id: str, category: str, confidence: float, article_id: str):
+    def update_user_preferences(self, user_id: str, category: str, confidence: float, article_id: str, weight: float = 1.0):
         """
         Update user preferences based on article interaction
         Args:
@@ -270,11 +431,37 @@ class RecommendationSystem:
             category: Article category
             confidence: Classification confidence
             article_id: Article identifier
+            weight: Strength of the interaction, counted as this many reads
         """
         try:
-            self.user_preferences[user_id].update_preferences(category, confidence, article_id)
+            self._update_vectors()
+            user = self.user_preferences[user_id]
+            is_new = article_id not in user.read_articles
+            user.update_preferences(category, confidence, article_id, weight)
+            
+            # Keep the user's profile up to date so recommendations don't rebuild it
+            if is_new:
+                user.pending_reads[article_id] = weight
+                self._fold_pending_reads(user)
         except Exception as e:
-            logger.error(f"Error updating user preferences: {str(e)}")
+            logger.error("Error updating user preferences: %s", e)
+    
+    def _fold_pending_reads(self, user: UserPreferences):
+        """
+        Add the user's pending reads to their profile, for those articles that now have vectors
+        A profile built before the IDF weights were refit or before read articles were
+        evicted is rebuilt from the reads whose articles are still stored; reads of
+        evicted articles stay pending in case the article is added again
+        Args:
+            user: The user's preferences
+        """
+        if user.profile_version != self._vectors_version:
+            user.reset_profile(self._vectors_version)
+        for article_id in [aid for aid in user.pending_reads if aid in self._row_index]:
+            row = self._row_index[article_id]
+            weight = user.pending_reads.pop(article_id)
+            user.add_to_profile(self.article_vectors[row].toarray().ravel(), weight)
+            user.profile_reads[article_id] = weight
     
     def get_recommendations(self, user_id: str, num_recommendations: int = 5) -> List[Article]:
         """
@@ -290,11 +477,15 @@ class RecommendationSystem:
                 logger.warning("No articles available for recommendations")
                 return []
             
+            # Vectorize any articles added since the last call
+            self._update_vectors()
+            
             if self.article_vectors is None:
                 logger.warning("No article vectors available")
                 return self._get_diverse_recent_articles(num_recommendations)
             
             user = self.user_preferences[user_id]
+            self._fold_pending_reads(user)
             
             # Handle new users with diverse recent articles
             if len(user.read_articles) == 0:
@@ -314,164 +505,93 @@ class RecommendationSystem:
                 reverse=True
             )
             
-            # Calculate user profile from read articles
-            read_vectors = []
-            for aid in user.read_articles:
-                if aid in self.articles and self.articles[aid].vector is not None:
-                    vec = self.articles[aid].vector
-                    if isinstance(vec, np.ndarray):
-                        read_vectors.append(vec)
-                    else:
-                        try:
-                            read_vectors.append(vec.toarray())
-                        except:
-                            continue
-            
-            if not read_vectors:
+            # User profile: mean of the read articles' TF-IDF vectors, kept as a running sum
+            if not user.profile_count:
                 logger.warning("No valid read vectors found")
                 return self._get_diverse_recent_articles(num_recommendations)
+            user_profile = user.profile_sum / user.profile_count
+            logger.info("User profile shape: %s", user_profile.shape)
             
-            try:
-                # Calculate user profile as mean of read article vectors
-                read_vectors = np.vstack(read_vectors)
-                user_profile = np.mean(read_vectors, axis=0)
-                logger.info(f"User profile shape: {user_profile.shape}")
-            except Exception as e:
-                logger.error(f"Error calculating user profile: {str(e)}")
+            # Score every article at once: one sparse matrix-vector product for the
+            # similarities, and whole-array ops for the other factors. Article rows are
+            # already L2-normalized, so only the profile needs normalizing
+            profile_norm = np.linalg.norm(user_profile)
+            if profile_norm == 0:
+                logger.warning("User profile has no terms")
                 return self._get_diverse_recent_articles(num_recommendations)
+            similarities = self.article_vectors @ (user_profile / profile_norm)
             
-            # Calculate article scores considering multiple factors
-            article_scores = []
-            for article_id in self.article_ids:
-                try:
-                    if article_id in user.read_articles:
-                        continue
-                        
-                    article = self.articles[article_id]
-                    if article.vector is None:
-                        continue
-                    
-                    # Convert article vector to numpy array
-                    if isinstance(article.vector, np.ndarray):
-                        article_vec = article.vector
-                    else:
-                        try:
-                            article_vec = article.vector.toarray()
-                        except:
-                            continue
-                    
-                    # Ensure vectors have same shape
-                    if article_vec.shape != user_profile.shape:
-                        article_vec = article_vec.reshape(user_profile.shape)
-                    
-                    # Calculate cosine similarity with zero handling
-                    norm_user = np.linalg.norm(user_profile)
-                    norm_article = np.linalg.norm(article_vec)
-                    
-                    if norm_user == 0 or norm_article == 0:
-                        similarity = 0.0
-                    else:
-                        similarity = float(np.dot(user_profile, article_vec) / (norm_user * norm_article))
-                    
-                    # Time decay factor
-                    time_diff = (datetime.now(timezone.utc) - article.published_datetime).days
-                    time_decay = np.exp(-0.1 * time_diff)
-                    
-                    # Enhanced category preference factor
-                    # Get the preference score for this article's category
-                    category_preference = category_preferences.get(article.category, 0.0)
-                    
-                    # Boost score for articles in user's preferred categories
-                    category_boost = 1.0
-                    if category_preference > 0:
-                        # Calculate how high this category ranks in user's preferences
-                        category_rank = next(
-                            (i for i, (cat, _) in enumerate(sorted_categories) if cat == article.category),
-                            len(sorted_categories)
-                        )
-                        # Boost decreases as rank increases
-                        category_boost = 1.0 + (1.0 / (category_rank + 1))
-                    
-                    # Source diversity factor
-                    source_factor = 1.0 / (self.source_diversity[article.source] ** 0.5)
-                    
-                    # Combined score with enhanced category weighting
-                    final_score = similarity * time_decay * category_boost * source_factor
-                    article_scores.append((article_id, final_score))
-                    
-                except Exception as e:
-                    logger.error(f"Error processing article {article_id}: {str(e)}")
-                    continue
+            # Time decay factor (whole days since publication). Timestamps need float64
+            # precision, but the decay itself is scored in float32 like the vectors
+            days = np.floor((time.time() - self._published_ts) / 86400.0)
+            days *= -0.1
+            time_decay = np.exp(days, out=days).astype(np.float32)
             
-            if not article_scores:
-                logger.warning("No article scores calculated")
-                return self._get_diverse_recent_articles(num_recommendations)
+            # Boost articles in the user's preferred categories; the boost decreases
+            # as the category's rank in the user's preferences increases
+            boost_by_category = np.ones(len(self._category_ids), dtype=np.float32)
+            for rank, (cat, score) in enumerate(sorted_categories):
+                if score > 0 and cat in self._category_ids:
+                    boost_by_category[self._category_ids[cat]] = 1.0 + (1.0 / (rank + 1))
+            category_boost = boost_by_category[self._row_categories]
             
-            # Sort by score and ensure source diversity
-            article_scores.sort(key=lambda x: x[1], reverse=True)
-            recommended_articles = []
-            seen_sources = set()
+            # Source diversity factor
+            source_factor = self.source_diversity[self._row_sources].astype(np.float32)
+            np.power(source_factor, np.float32(-0.5), out=source_factor)
             
-            # Define score thresholds
-            HIGH_SCORE_THRESHOLD = 0.8  # Very high quality articles
-            MIN_SCORE_THRESHOLD = 0.3   # Minimum acceptable quality
+            # Combined score with enhanced category weighting, multiplied in place into
+            # the similarity array so no intermediate products are allocated; read
+            # articles never qualify
+            scores = similarities
+            scores *= time_decay
+            scores *= category_boost
+            scores *= source_factor
+            read_rows = [self._row_index[aid] for aid in user.read_articles if aid in self._row_index]
+            scores[read_rows] = -np.inf
+            # Articles whose text hashed to no terms (e.g. only stop words) carry no signal
+            scores[np.diff(self.article_vectors.indptr) == 0] = -np.inf
             
-            for article_id, score in article_scores:
-                if len(recommended_articles) >= num_recommendations:
-                    break
-                
-                # Skip articles below minimum quality threshold
-                if score < MIN_SCORE_THRESHOLD:
-                    continue
-                
-                article = self.articles[article_id]
-                
-                # Allow high-scoring articles to break source diversity
-                if (article.source not in seen_sources or 
-                    len(seen_sources) >= num_recommendations // 2 or 
-                    score > HIGH_SCORE_THRESHOLD):
-                    recommended_articles.append(article)
-                    seen_sources.add(article.source)
+            best_score = scores.max() if scores.size else -np.inf
+            if best_score <= 0:
+                logger.warning("No article is similar to the user's profile")
+                return self._get_diverse_recent_articles(num_recommendations)
+            
+            # Minimum acceptable quality, relative to the best candidate since the
+            # absolute scale of TF-IDF similarities depends on the corpus
+            MIN_SCORE_THRESHOLD = max(0.3 * best_score, _MIN_SCORE_FLOOR)
+            
+            # Rank the top candidates above the threshold, then ensure source
+            # diversity by taking each source's best article before any repeats
+            candidates = np.flatnonzero(scores >= MIN_SCORE_THRESHOLD)
+            head = num_recommendations * 3
+            top_rows = itertools.islice(_rank_rows(scores, candidates, head), head)
+            recommended_articles = _interleave_by_source(
+                (self.articles[self._row_ids[row]] for row in top_rows),
+                num_recommendations
+            )
             
-            logger.info(f"Returning {len(recommended_articles)} recommendations")
+            logger.info("Returning %d recommendations", len(recommended_articles))
             return recommended_articles
             
         except Exception as e:
-            logger.error(f"Error getting recommendations: {str(e)}")
+            logger.error("Error getting recommendations: %s", e)
             return self._get_diverse_recent_articles(num_recommendations)
     
     def _get_diverse_recent_articles(self, num_articles: int) -> List[Article]:
         """Get recent articles from diverse sources"""
         try:
-            # Convert datetime objects to timestamps for comparison
-            articles_with_timestamps = [
-                (article, article.published_datetime.timestamp())
-                for article in self.articles.values()
-            ]
-            
-            # Sort articles by timestamp
+            # Sort articles by their cached publish timestamps
             recent_articles = sorted(
-                articles_with_timestamps,
-                key=lambda x: x[1],
+                self.articles.values(),
+                key=lambda x: x.published_ts,
                 reverse=True
             )
             
-            recommended = []
-            seen_sources = set()
-            
-            for article, _ in recent_articles:
-                if len(recommended) >= num_articles:
-                    break
-                    
-                # Ensure source diversity
-                if article.source not in seen_sources or len(seen_sources) >= num_articles // 2:
-                    recommended.append(article)
-                    seen_sources.add(article.source)
-            
-            return recommended
+            # Ensure source diversity among the most recent articles
+            return _interleave_by_source(recent_articles[:num_articles * 3], num_articles)
             
         except Exception as e:
-            logger.error(f"Error getting diverse recent articles: {str(e)}")
+            logger.error("Error getting diverse recent articles: %s", e)
             # Return first num_articles as fallback
             return list(self.articles.values())[:num_articles]
     
\ No newline at end of file
@@ -1,4 +1,5 @@
 import requests
+import orjson
 import json
 from collections import Counter
 from typing import List, Dict
@@ -6,6 +7,9 @@ import matplotlib.pyplot as plt
 import time
 from datetime import datetime, timedelta
 
+# Shared session: keeps the connection to the backend alive between requests
+SESSION = requests.Session()
+
 def fetch_articles(category: str, page_size: int = 50, timestamp: int = None) -> List[Dict]:
     """
     Fetch articles for a specific category
@@ -26,18 +30,17 @@ def fetch_articles(category: str, page_size: int = 50, timestamp: int = None) ->
         "timestamp": timestamp
     }
     
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     if response.status_code != 200:
         raise Exception(f"Failed to fetch articles: {response.text}")
     
-    return response.json()
+    return orjson.loads(response.content)
 
 def analyze_category_distribution(articles: List[Dict]) -> Dict[str, int]:
     """
     Analyze the distribution of categories in the fetched articles
     """
-    categories = [article['category'].lower() for article in articles]
-    return dict(Counter(categories))
+    return dict(Counter(article['category'].lower() for article in articles))
 
 def plot_distribution(distribution: Dict[str, int], category: str, run_number: int = None):
     """
@@ -1,10 +1,14 @@
 import requests
+import orjson
 import time
 from typing import List, Dict
 import statistics
 from datetime import datetime
 import matplotlib.pyplot as plt
 
+# Shared session: keeps the connection to the backend alive between requests
+SESSION = requests.Session()
+
 def fetch_articles(category: str, page_size: int = 50, timestamp: int = None) -> List[Dict]:
     """
     Fetch articles for a specific category
@@ -21,11 +25,11 @@ def fetch_articles(category: str, page_size: int = 50, timestamp: int = None) ->
         "timestamp": timestamp
     }
     
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     if response.status_code != 200:
         raise Exception(f"Failed to fetch articles: {response.text}")
     
-    return response.json()
+    return orjson.loads(response.content)
 
 def measure_fetch_time(category: str, num_runs: int = 5) -> Dict:
     """
@@ -22,20 +22,88 @@ recommendation system's core functionality.
 
 import sys
 import os
+import pytest
 import json
+import hashlib
+import orjson
+from functools import lru_cache
 from datetime import datetime, timedelta
 from recommendation import RecommendationSystem, Article
 from category_mappings import SUBCATEGORY_MAPPINGS, MAIN_CATEGORIES
 from collections import defaultdict
-from model_utils import test_classify_article
+from model_utils import model, test_classify_article, test_classify_article_batch
 
 
+# Classification results persisted between runs, keyed by a hash of the article text.
+# The file records which model produced them and is discarded when the model changes
+_CLASSIFY_CACHE_FILE = os.path.join(os.path.dirname(__file__), "test_data", "classify_cache.json")
+
+def _model_identity():
+    """Identify the loaded classification model: its name plus hub revision or local checkpoint mtime"""
+    name = model.config.name_or_path
+    revision = getattr(model.config, "_commit_hash", None)
+    if revision is None and os.path.exists(name):
+        revision = os.path.getmtime(name)
+    return f"{name}@{revision}"
+
+def _load_classify_cache():
+    """Load cached classifications from previous runs of the same model"""
+    try:
+        with open(_CLASSIFY_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("model") != _model_identity():
+        return {}
+    return data.get("results", {})
+
+_CLASSIFY_CACHE = _load_classify_cache()
+
+def save_classify_cache():
+    """Persist cached classifications so later runs can skip the model"""
+    os.makedirs(os.path.dirname(_CLASSIFY_CACHE_FILE), exist_ok=True)
+    with open(_CLASSIFY_CACHE_FILE, 'w') as f:
+        json.dump({"model": _model_identity(), "results": _CLASSIFY_CACHE}, f)
+
+def _classify_cache_key(title, content):
+    return hashlib.sha1(f"{title}\0{content}".encode()).hexdigest()
+
 def classify_article(title, content):
+    # The same article is often recommended to several users; only run the
+    # model the first time its text is seen
+    key = _classify_cache_key(title, content)
+    cached = _CLASSIFY_CACHE.get(key)
+    if cached is not None:
+        return cached[0], cached[1]
+    
     # Call a the classification method from main.py
     predicted_label, confidence = test_classify_article(title, content)
+    _CLASSIFY_CACHE[key] = (predicted_label, confidence)
         
     return predicted_label, confidence
 
+def classify_articles(articles):
+    """Classify every article not already cached, in one batched model call"""
+    pending = {}
+    for article in articles:
+        key = _classify_cache_key(article.title, article.content)
+        if key not in _CLASSIFY_CACHE:
+            pending[key] = article
+    if not pending:
+        return
+    
+    results = test_classify_article_batch(
+        [article.title for article in pending.values()],
+        [article.content for article in pending.values()]
+    )
+    _CLASSIFY_CACHE.update(zip(pending.keys(), results))
+
+@lru_cache(maxsize=4)
+def _parse_test_articles(filepath, mtime):
+    """Parse a test data file; mtime is part of the cache key so a regenerated file is re-read"""
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
 def load_test_articles(filename="test_articles.json"):
     """Load articles from the test data JSON file"""
     try:
@@ -50,12 +118,11 @@ def load_test_articles(filename="test_articles.json"):
             print("Please ensure the test_articles.json file exists in the test_data directory.")
             return []
             
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            print(f"\nLoaded {data['metadata']['total_articles']} articles")
-            print(f"Categories: {', '.join(data['metadata']['categories'])}")
-            print(f"Fetched at: {data['metadata']['fetched_at']}")
-            return data['articles']
+        data = _parse_test_articles(filepath, os.path.getmtime(filepath))
+        print(f"\nLoaded {data['metadata']['total_articles']} articles")
+        print(f"Categories: {', '.join(data['metadata']['categories'])}")
+        print(f"Fetched at: {data['metadata']['fetched_at']}")
+        return list(data['articles'])
     except Exception as e:
         print(f"Error loading test articles: {str(e)}")
         print(f"Current working directory: {os.getcwd()}")
@@ -109,8 +176,15 @@ def evaluate_recommendations(recommendations, user_category):
     print(f"\nAccuracy: {accuracy:.2%} ({correct}/{total} correct)")
     return accuracy
 
-def test_recommendation_system():
-    """Test the recommendation system with saved articles and evaluate accuracy"""
+@pytest.mark.parametrize("classify_upfront", [False, True])
+def test_recommendation_system(classify_upfront):
+    """
+    Test the recommendation system with saved articles and evaluate accuracy
+    Args:
+        classify_upfront: Label every article with the model before adding it,
+            instead of keeping the fetched categories and only classifying the
+            recommendations
+    """
     print("\nTesting recommendation system...")
     # Initialize recommendation system
     rec_system = RecommendationSystem()
@@ -125,20 +199,16 @@ def test_recommendation_system():
     print("\nCreating article objects...")
     articles = create_article_objects(articles_data)
     
+    # Classify articles before they're added to the system, in one batch
+    if classify_upfront:
+        print("\nClassifying articles with AI model...")
+        classify_articles(articles)
+        for article in articles:
+            article.category, article.confidence = classify_article(article.title, article.content)
+    
     # Add articles to recommendation system
     print("\nAdding articles to recommendation system...")
-    for article in articles:
-        rec_system.add_article(article)
-    
-    # # Classify articles after they're added to the system
-    # print("\nClassifying articles with AI model...")
-    # for article_id, article in rec_system.articles.items():
-    #     predicted_category, confidence = classify_article(article.title, article.content)
-    #     article.category = predicted_category
-    #     article.confidence = confidence
-    #     print(f"Classified: {article.title}")
-    #     print(f"Category: {predicted_category}")
-    #     print(f"Confidence: {confidence:.2f}\n")
+    rec_system.add_articles(articles)
     
     # Create user profiles
     users = {
@@ -150,11 +220,15 @@ def test_recommendation_system():
         "diverse_user": {"category": "all", "articles": []}
     }
     
-    # Find articles for each user profile
+    # Find articles for each user profile, grouping the articles by category once
+    articles_by_category = defaultdict(list)
     for article_id, article in rec_system.articles.items():
-        for user_id, user_data in users.items():
-            if user_data["category"] == "all" or article.category == user_data["category"]:
-                user_data["articles"].append(article_id)
+        articles_by_category[article.category].append(article_id)
+    for user_id, user_data in users.items():
+        if user_data["category"] == "all":
+            user_data["articles"] = list(rec_system.articles)
+        else:
+            user_data["articles"] = articles_by_category.get(user_data["category"], [])
     
     # Update user preferences
     print("\nUpdating user preferences...")
@@ -170,16 +244,24 @@ def test_recommendation_system():
             )
         print(f"Updated preferences for {user_id}")
     
-    # Get and evaluate recommendations
+    # Get recommendations for every user, then classify them all in one batch
     print("\nGetting and evaluating recommendations...")
-    results = defaultdict(dict)
+    user_recommendations = {
+        user_id: rec_system.get_recommendations(user_id, num_recommendations=5)
+        for user_id in users
+    }
+    classify_articles(
+        article for recommendations in user_recommendations.values() for article in recommendations
+    )
+    
+    results = []  # (user_id, accuracy) pairs
     for user_id, user_data in users.items():
         print(f"\nRecommendations for {user_id}:")
-        recommendations = rec_system.get_recommendations(user_id, num_recommendations=5)
+        recommendations = user_recommendations[user_id]
         
         # Calculate accuracy using classification
         accuracy = evaluate_recommendations(recommendations, user_data["category"])
-        results[user_id]["accuracy"] = accuracy
+        results.append((user_id, accuracy))
         
         # Print recommendations and their categories
         for i, article in enumerate(recommendations, 1):
@@ -189,11 +271,13 @@ def test_recommendation_system():
             print(f"   Source: {article.source}")
             print(f"   Published: {article.published_datetime}")
         print(f"\nAccuracy for {user_id}: {accuracy:.2%}")
+    save_classify_cache()
     # Print overall results
     print("\nOverall Results:")
     print("-" * 50)
-    for user_id, data in results.items():
-        print(f"{user_id}: {data['accuracy']:.2%} accuracy")
+    for user_id, accuracy in results:
+        print(f"{user_id}: {accuracy:.2%} accuracy")
 
 if __name__ == "__main__":
-    test_recommendation_system() 
\ No newline at end of file
+    test_recommendation_system(False)
+    test_recommendation_system(True) 
\ No newline at end of file
@@ -3,28 +3,45 @@ from recommendation import RecommendationSystem, Article
 from datetime import datetime, timedelta
 import json
 import os
+import time
 from typing import List, Dict
-import matplotlib.pyplot as plt
 import numpy as np
 import logging
 import asyncio
+from collections import Counter
 from news_fetcher import NewsFetcher
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fetched articles are saved here and reused by later runs until they are a day old;
+# delete the file to refetch sooner
+ARTICLE_CACHE_FILE = 'test_data/quality_articles_cache.json'
+ARTICLE_CACHE_MAX_AGE = 86400  # Seconds
+
+# Search queries used to collect articles for each category
+CATEGORY_QUERIES = {
+    'Politics': ['election', 'congress', 'government', 'policy', 'democrat', 'republican'],
+    'Technology': ['artificial intelligence', 'software', 'hardware', 'innovation', 'digital'],
+    'Business': ['market', 'economy', 'finance', 'stock', 'investment'],
+    'Entertainment': ['movie', 'music', 'celebrity', 'film', 'entertainment'],
+    'Sports': ['football', 'basketball', 'soccer', 'sport', 'championship']
+}
+
+# Simulated users and the single category each one prefers
+TEST_USERS = {
+    'user_politics': 'Politics',
+    'user_tech': 'Technology',
+    'user_business': 'Business',
+    'user_entertainment': 'Entertainment',
+    'user_sports': 'Sports'
+}
+
 class TestRecommendationQuality(unittest.TestCase):
     def setUp(self):
         self.recommendation_system = RecommendationSystem()
         self.news_fetcher = NewsFetcher()
-        self.test_users = {
-            'user_politics': {'Politics': 1.0},
-            'user_tech': {'Technology': 1.0},
-            'user_business': {'Business': 1.0},
-            'user_entertainment': {'Entertainment': 1.0},
-            'user_sports': {'Sports': 1.0}
-        }
         
         # Create test data directory if it doesn't exist
         os.makedirs('test_data', exist_ok=True)
@@ -33,84 +50,105 @@ class TestRecommendationQuality(unittest.TestCase):
         self._fetch_test_articles()
         
     def _fetch_test_articles(self):
-        """Fetch real articles for each category"""
-        category_queries = {
-            'Politics': ['election', 'congress', 'government', 'policy', 'democrat', 'republican'],
-            'Technology': ['artificial intelligence', 'software', 'hardware', 'innovation', 'digital'],
-            'Business': ['market', 'economy', 'finance', 'stock', 'investment'],
-            'Entertainment': ['movie', 'music', 'celebrity', 'film', 'entertainment'],
-            'Sports': ['football', 'basketball', 'soccer', 'sport', 'championship']
-        }
+        """Fetch real articles for each category, reusing those saved by a previous run"""
+        if (os.path.exists(ARTICLE_CACHE_FILE)
+                and time.time() - os.path.getmtime(ARTICLE_CACHE_FILE) < ARTICLE_CACHE_MAX_AGE):
+            with open(ARTICLE_CACHE_FILE, 'r') as f:
+                articles_by_category = json.load(f)
+            logger.info(f"Loaded cached test articles from {ARTICLE_CACHE_FILE}")
+        else:
+            articles_by_category = self._fetch_articles_by_category()
+            with open(ARTICLE_CACHE_FILE, 'w') as f:
+                json.dump(articles_by_category, f)
+        
+        # An article can match queries from several categories; keep the first
+        # category it was found under so each article is only added once
+        unique_articles = {}
+        for category, articles in articles_by_category.items():
+            for article in articles:
+                unique_articles.setdefault(article["article_id"], (category, article))
+        
+        self.recommendation_system.add_articles(
+            Article(
+                article_id=article["article_id"],
+                title=article["title"],
+                content=article["content"],
+                category=category,  # Use the category we searched for
+                confidence=0.9,     # High confidence since we searched by category
+                source=article["source"],
+                url=article["url"],
+                published_at=article["published_at"],
+                image_url=article["image_url"]
+            )
+            for category, article in unique_articles.values()
+        )
         
+        # Force vector update after adding all articles
+        self.recommendation_system._update_vectors()
+        logger.info(f"Added {len(self.recommendation_system.articles)} articles to the system")
+    
+    def _fetch_articles_by_category(self) -> Dict[str, List[Dict]]:
+        """Fetch real articles for each category from the news sources"""
         async def fetch_category_articles(category: str):
             try:
-                # Use multiple queries for each category to get diverse content
-                all_articles = []
-                for query in category_queries[category]:
-                    articles = await self.news_fetcher.fetch_articles(
+                # Use multiple queries for each category to get diverse content,
+                # running them concurrently
+                results = await asyncio.gather(*[
+                    self.news_fetcher.fetch_articles(
                         query=query,
                         page_size=10,  # 10 articles per query
                         days_back=14,  # Articles from the last 14 days
                         force_refresh=True
                     )
-                    all_articles.extend(articles)
+                    for query in CATEGORY_QUERIES[category]
+                ])
                 
                 # Remove duplicates based on article_id
-                unique_articles = {article["article_id"]: article for article in all_articles}.values()
+                unique_articles = {
+                    article["article_id"]: article for articles in results for article in articles
+                }.values()
                 logger.info(f"Fetched {len(unique_articles)} unique articles for category: {category}")
                 return list(unique_articles)
             except Exception as e:
                 logger.error(f"Error fetching articles for {category}: {str(e)}")
                 return []
         
-        # Fetch articles for all categories
-        for category in category_queries.keys():
-            articles = asyncio.run(fetch_category_articles(category))
-            for article in articles:
-                article_obj = Article(
-                    article_id=article["article_id"],
-                    title=article["title"],
-                    content=article["content"],
-                    category=category,  # Use the category we searched for
-                    confidence=0.9,     # High confidence since we searched by category
-                    source=article["source"],
-                    url=article["url"],
-                    published_at=article["published_at"],
-                    image_url=article["image_url"]
-                )
-                self.recommendation_system.add_article(article_obj)
+        # Fetch articles for all categories concurrently, in a single event loop
+        async def fetch_all():
+            return await asyncio.gather(*[
+                fetch_category_articles(category) for category in CATEGORY_QUERIES
+            ])
         
-        # Force vector update after adding all articles
-        self.recommendation_system._update_vectors()
-        logger.info(f"Added {len(self.recommendation_system.articles)} articles to the system")
+        return dict(zip(CATEGORY_QUERIES.keys(), self.news_fetcher.run(fetch_all())))
         
     def test_recommendation_quality(self):
         """Test the quality of recommendations for users with different preferences"""
         results = {}
         
-        for user_id, preferences in self.test_users.items():
+        # Group the articles by category once, rather than scanning them for every user
+        articles_by_category = {category: [] for category in CATEGORY_QUERIES}
+        for article_id, article in self.recommendation_system.articles.items():
+            articles_by_category.setdefault(article.category, []).append(article_id)
+        
+        for user_id, preferred_category in TEST_USERS.items():
             print(f"\nTesting recommendations for {user_id}")
             
             # Update user preferences by simulating article reads
-            preferred_category = list(preferences.keys())[0]
             print(f"Adding articles to user preferences for category: {preferred_category}")
             
             # Find articles in the preferred category
-            category_articles = [
-                article_id for article_id, article in self.recommendation_system.articles.items()
-                if article.category == preferred_category
-            ]
+            category_articles = articles_by_category[preferred_category]
             
             # Add more articles to user preferences (up to 20 instead of 12)
             for i, article_id in enumerate(category_articles[:20]):
-                # Add each article multiple times to strengthen the preference
-                for _ in range(3):  # Add each article 3 times
-                    self.recommendation_system.update_user_preferences(
-                        user_id=user_id,
-                        category=preferred_category,
-                        confidence=1.0,
-                        article_id=article_id
-                    )
+                # Count each read as 3 interactions to strengthen the preference
+                self.recommendation_system.update_user_preferences(
+                    user_id=user_id,
+                    category=preferred_category,
+                    confidence=1.0,
+                    article_id=article_id,
+                    weight=3.0
+                )
             
             # Get recommendations for the user
             recommendations = self.recommendation_system.get_recommendations(
@@ -123,10 +161,7 @@ class TestRecommendationQuality(unittest.TestCase):
                 continue
             
             # Analyze category distribution
-            category_counts = {}
-            for article in recommendations:
-                category = article.category
-                category_counts[category] = category_counts.get(category, 0) + 1
+            category_counts = dict(Counter(article.category for article in recommendations))
             
             # Calculate preference match score
             preference_match = category_counts.get(preferred_category, 0) / len(recommendations)
@@ -157,11 +192,16 @@ class TestRecommendationQuality(unittest.TestCase):
         with open('test_data/recommendation_quality_results.json', 'w') as f:
             json.dump(results, f, indent=2)
         
-        # Plot results
-        self.plot_recommendation_quality(results)
+        # Plot results; matplotlib is only imported when SCR_PLOT=1
+        if os.getenv('SCR_PLOT') == '1':
+            self.plot_recommendation_quality(results)
         
     def plot_recommendation_quality(self, results: Dict):
         """Plot the recommendation quality results"""
+        import matplotlib
+        matplotlib.use('Agg')  # Render straight to file, no GUI backend
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(15, 10))
         
         # Create subplots
@@ -176,10 +216,13 @@ class TestRecommendationQuality(unittest.TestCase):
         x = np.arange(len(results))
         width = 0.15
         
+        # Article counts per user (rows) and category (columns), built in one pass
+        counts = np.array([
+            [result['category_distribution'].get(category, 0) for category in categories]
+            for result in results.values()
+        ])
         for i, category in enumerate(categories):
-            values = [results[user_id]['category_distribution'].get(category, 0) 
-                     for user_id in results.keys()]
-            ax1.bar(x + i*width, values, width, label=category)
+            ax1.bar(x + i*width, counts[:, i], width, label=category)
         
         ax1.set_ylabel('Number of Articles')
         ax1.set_title('Category Distribution in Recommendations')